@@ -225,11 +225,13 @@ class StateManager:
             }
 
         # Add available tools for current phase
-        allowed_categories = ALLOWED_TOOLS_BY_PHASE.get(self.state.phase, set())
+        allowed_categories = {
+            c.value for c in ALLOWED_TOOLS_BY_PHASE.get(self.state.phase, set())
+        }
         available_tools = [
-            t.get_schema()
-            for t in tool_registry.list_all()
-            if t.category in allowed_categories
+            tool_registry.get_full_schema(summary["name"])
+            for summary in tool_registry.get_summaries()
+            if summary["category"] in allowed_categories
         ]
         brief["available_tools"] = available_tools
 
@@ -18,7 +18,12 @@ from .base import (
 # Import all tools to register them
 from .read_file import ReadFileTool
 from .list_directory import ListDirectoryTool
-from .apply_patch import ApplyPatchTool, preview_patch
+from .apply_patch import (
+    ApplyPatchTool,
+    preview_patch,
+    can_apply_patch,
+    render_patch_preview,
+)
 from .run_command import RunCommandTool, run_command_simple
 from .ask_user import AskUserTool
 from .final_answer import FinalAnswerTool, mark_task_complete
@@ -83,6 +88,9 @@ from .ci_tools import (
     check_ci_status,
     get_ci_logs,
     check_ci_result,
+    acheck_ci_status,
+    aget_ci_logs,
+    acheck_ci_result,
     wait_for_ci,
     analyze_ci_failure,
     suggest_ci_fix,
@@ -266,6 +274,8 @@ __all__ = [
     "DeadCodeCheckTool",
     # Utility functions
     "preview_patch",
+    "can_apply_patch",
+    "render_patch_preview",
     "run_command_simple",
     "mark_task_complete",
     "write_file",
@@ -289,6 +299,9 @@ __all__ = [
     "check_ci_status",
     "get_ci_logs",
     "check_ci_result",
+    "acheck_ci_status",
+    "aget_ci_logs",
+    "acheck_ci_result",
     "wait_for_ci",
     "analyze_ci_failure",
     "suggest_ci_fix",
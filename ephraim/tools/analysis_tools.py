@@ -13,45 +13,96 @@ Commands:
 import os
 import re
 import subprocess
-from typing import Dict, Any, List, Optional, Set
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 from .base import BaseTool, ToolResult, ToolParam, ToolCategory, register_tool
 
 
-def run_grep(
-    pattern: str,
+# Strips anything a whole-word match may report around the word itself
+_NON_WORD_EDGES = re.compile(r'^\W+|\W+$')
+
+
+def _grep_output(
+    patterns: List[str],
     path: str,
-    file_types: Optional[List[str]] = None,
-    context: int = 0,
-) -> List[Dict[str, Any]]:
-    """Run grep/ripgrep to find pattern matches."""
-    matches = []
+    file_types: Optional[List[str]],
+    rg_flags: List[str],
+    grep_flags: List[str],
+    literal: bool = False,
+    word: bool = False,
+) -> Optional[str]:
+    """
+    Run ripgrep (falling back to grep) and return its stdout.
+
+    Several patterns are fed through stdin with '-f -' so they are all
+    searched in a single pass over the tree.
+    """
+    # Both tools share the fixed-string and whole-word flags
+    match_flags = []
+    if literal:
+        match_flags.append('-F')
+    if word:
+        match_flags.append('-w')
+    rg_flags = rg_flags + match_flags
+    grep_flags = grep_flags + match_flags
+
+    if len(patterns) == 1:
+        pattern_args = [patterns[0], path]
+        stdin = None
+    else:
+        pattern_args = ['-f', '-', path]
+        stdin = '\n'.join(patterns) + '\n'
 
     # Try ripgrep first, fall back to grep
     try:
-        cmd = ['rg', '--line-number', '--no-heading']
-        if context > 0:
-            cmd.extend(['-C', str(context)])
+        cmd = ['rg', *rg_flags]
         if file_types:
             for ft in file_types:
                 cmd.extend(['-g', f'*.{ft}'])
-        cmd.extend([pattern, path])
+        cmd.extend(pattern_args)
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        output = result.stdout
+        result = subprocess.run(cmd, input=stdin, capture_output=True, text=True, timeout=30)
+        return result.stdout
     except FileNotFoundError:
         # Fall back to grep
-        cmd = ['grep', '-rn']
-        if context > 0:
-            cmd.extend(['-C', str(context)])
+        cmd = ['grep', *grep_flags]
         if file_types:
             include = ' '.join(f'--include=*.{ft}' for ft in file_types)
             cmd.extend(include.split())
-        cmd.extend([pattern, path])
+        cmd.extend(pattern_args)
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        output = result.stdout
+        result = subprocess.run(cmd, input=stdin, capture_output=True, text=True, timeout=30)
+        return result.stdout
     except Exception:
+        return None
+
+
+def run_grep(
+    pattern: str,
+    path: str,
+    file_types: Optional[List[str]] = None,
+    context: int = 0,
+    literal: bool = False,
+    word: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Run grep/ripgrep to find pattern matches.
+
+    With literal=True the pattern is matched as a fixed string, and with
+    word=True only whole-word occurrences match.
+    """
+    matches = []
+
+    rg_flags = ['--line-number', '--no-heading']
+    grep_flags = ['-rn']
+    if context > 0:
+        rg_flags.extend(['-C', str(context)])
+        grep_flags.extend(['-C', str(context)])
+
+    output = _grep_output([pattern], path, file_types, rg_flags, grep_flags, literal, word)
+    if output is None:
         return matches
 
     # Parse output
@@ -71,11 +122,105 @@ def run_grep(
     return matches
 
 
+def count_word_occurrences(
+    symbols: List[str],
+    path: str,
+    file_types: Optional[List[str]] = None,
+) -> Dict[str, int]:
+    """
+    Count whole-word occurrences of many literal symbols in one search.
+
+    Returns a mapping of symbol to number of occurrences (0 if unseen).
+    """
+    counts = dict.fromkeys(symbols, 0)
+    if not counts:
+        return counts
+
+    output = _grep_output(
+        list(counts),
+        path,
+        file_types,
+        ['--only-matching', '--no-filename', '--no-line-number'],
+        ['-rho'],
+        literal=True,
+        word=True,
+    )
+    if not output:
+        return counts
+
+    # Format: one matched symbol per line
+    for line in output.split('\n'):
+        symbol = _NON_WORD_EDGES.sub('', line)
+        if symbol in counts:
+            counts[symbol] += 1
+
+    return counts
+
+
 def get_file_extension(filepath: str) -> str:
     """Get file extension without dot."""
     return os.path.splitext(filepath)[1].lstrip('.')
 
 
+class _PathIndex:
+    """
+    Cache of the files under a directory tree, grouped by extension.
+
+    Repeated analysis calls over the same tree reuse the listing instead of
+    walking it again. An entry is rebuilt as soon as any indexed directory's
+    mtime changes, i.e. when a file is added, removed or renamed in it;
+    checking that costs one stat per indexed directory on every lookup.
+    Only the MAX_ROOTS most recently used trees are kept.
+    """
+
+    MAX_ROOTS = 8
+
+    def __init__(self):
+        self._entries: OrderedDict[
+            str, Tuple[Dict[str, float], Dict[str, List[str]]]
+        ] = OrderedDict()
+
+    def files_by_ext(self, path: str) -> Dict[str, List[str]]:
+        """Get files under path, keyed by extension (without dot)."""
+        root = os.path.abspath(path)
+        entry = self._entries.get(root)
+        if entry is not None and self._is_fresh(entry[0]):
+            self._entries.move_to_end(root)
+            return entry[1]
+
+        dir_mtimes: Dict[str, float] = {}
+        files: Dict[str, List[str]] = {}
+        for dirpath, _, filenames in os.walk(root):
+            try:
+                dir_mtimes[dirpath] = os.stat(dirpath).st_mtime
+            except OSError:
+                continue
+            for filename in filenames:
+                files.setdefault(get_file_extension(filename), []).append(
+                    os.path.join(dirpath, filename)
+                )
+
+        self._entries[root] = (dir_mtimes, files)
+        self._entries.move_to_end(root)
+        # Drop the least recently used trees
+        while len(self._entries) > self.MAX_ROOTS:
+            self._entries.popitem(last=False)
+        return files
+
+    def _is_fresh(self, dir_mtimes: Dict[str, float]) -> bool:
+        """Check that no indexed directory changed since it was listed."""
+        for dirpath, mtime in dir_mtimes.items():
+            try:
+                if os.stat(dirpath).st_mtime != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+
+_path_index = _PathIndex()
+
+
 def detect_language(filepath: str) -> str:
     """Detect programming language from file extension."""
     ext = get_file_extension(filepath)
@@ -98,6 +243,149 @@ def detect_language(filepath: str) -> str:
     return language_map.get(ext, "unknown")
 
 
+# Definition patterns by language, formatted with the escaped symbol
+DEFINITION_PATTERNS = {
+    "python": [
+        r'def\s+{symbol}\s*\(',
+        r'class\s+{symbol}[\s:(]',
+        r'{symbol}\s*=\s*(?!.*==)',  # Assignment (not comparison)
+    ],
+    "javascript": [
+        r'function\s+{symbol}\s*\(',
+        r'const\s+{symbol}\s*=',
+        r'let\s+{symbol}\s*=',
+        r'var\s+{symbol}\s*=',
+        r'class\s+{symbol}[\s{{]',
+        r'{symbol}\s*:\s*function',
+        r'{symbol}\s*=\s*\([^)]*\)\s*=>',
+    ],
+    "typescript": [
+        r'function\s+{symbol}\s*[<(]',
+        r'const\s+{symbol}\s*[:<]?\s*=',
+        r'let\s+{symbol}\s*[:<]?\s*=',
+        r'class\s+{symbol}[\s<{{]',
+        r'interface\s+{symbol}[\s<{{]',
+        r'type\s+{symbol}\s*[<=]',
+    ],
+    "go": [
+        r'func\s+{symbol}\s*\(',
+        r'func\s+\([^)]+\)\s+{symbol}\s*\(',  # Method
+        r'type\s+{symbol}\s+',
+        r'var\s+{symbol}\s+',
+        r'const\s+{symbol}\s*=',
+    ],
+    "rust": [
+        r'fn\s+{symbol}\s*[<(]',
+        r'struct\s+{symbol}[\s<{{]',
+        r'enum\s+{symbol}[\s<{{]',
+        r'trait\s+{symbol}[\s<{{]',
+        r'type\s+{symbol}\s*=',
+        r'const\s+{symbol}\s*:',
+        r'static\s+{symbol}\s*:',
+    ],
+}
+
+# File extensions searched for each language's definitions when no
+# file_types are given
+DEFINITION_FILE_TYPES = {
+    "python": ["py"],
+    "javascript": ["js", "jsx", "mjs"],
+    "typescript": ["ts", "tsx"],
+    "go": ["go"],
+    "rust": ["rs"],
+}
+_DEFINITION_EXTENSIONS = [ext for exts in DEFINITION_FILE_TYPES.values() for ext in exts]
+
+# Keywords that mark a matched line as a definition, by language
+DEFINITION_MARKERS = {
+    "python": ["def ", "class "],
+    "javascript": ["function ", "const ", "let ", "var ", "class "],
+    "typescript": ["function ", "const ", "let ", "class ", "interface ", "type "],
+    "go": ["func ", "type ", "var ", "const "],
+    "rust": ["fn ", "struct ", "enum ", "trait ", "type ", "const ", "static "],
+}
+
+# Keywords identifying the kind of definition
+DEFINITION_TYPES = {
+    "function": ["def ", "func ", "fn ", "function "],
+    "class": ["class "],
+    "struct": ["struct "],
+    "interface": ["interface ", "trait "],
+    "type": ["type "],
+    "variable": ["const ", "let ", "var ", "static "],
+    "enum": ["enum "],
+}
+
+
+@lru_cache(maxsize=64)
+def _definition_patterns(symbol: str) -> Dict[str, List[re.Pattern]]:
+    """Compile the definition patterns of every language for a symbol."""
+    escaped = re.escape(symbol)
+    return {
+        lang: [re.compile(p.format(symbol=escaped)) for p in patterns]
+        for lang, patterns in DEFINITION_PATTERNS.items()
+    }
+
+
+def _definition_language(
+    content: str,
+    candidates: List[str],
+    patterns: Dict[str, List[re.Pattern]],
+) -> Optional[str]:
+    """Return the language whose definition patterns match content, if any."""
+    for lang in candidates:
+        if not any(p.search(content) for p in patterns[lang]):
+            continue
+        # Check it's not just a usage
+        if any(marker in content for marker in DEFINITION_MARKERS[lang]):
+            return lang
+    return None
+
+
+def _definition_type(content: str) -> str:
+    """Determine what type of definition this is."""
+    for def_type, markers in DEFINITION_TYPES.items():
+        if any(marker in content for marker in markers):
+            return def_type
+    return "unknown"
+
+
+def _search_symbol(
+    symbol: str,
+    path: str,
+    file_types: Optional[List[str]] = None,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Search a symbol once and split the matches.
+
+    Returns (definitions, references). Definitions carry the detected
+    language and definition type.
+    """
+    matches = run_grep(symbol, path, file_types, literal=True, word=True)
+    patterns = _definition_patterns(symbol)
+
+    definitions: List[Dict[str, Any]] = []
+    references: List[Dict[str, Any]] = []
+
+    for match in matches:
+        content = match["content"]
+        language = detect_language(match["file"])
+        # Files of other languages are checked against every pattern set
+        candidates = [language] if language in patterns else list(patterns)
+
+        lang = _definition_language(content, candidates, patterns)
+        if lang:
+            definitions.append({
+                **match,
+                "language": lang,
+                "type": _definition_type(content),
+            })
+        else:
+            references.append(match)
+
+    return definitions, references
+
+
 @register_tool
 class FindReferencesTool(BaseTool):
     """
@@ -143,45 +431,8 @@ class FindReferencesTool(BaseTool):
         symbol = params["symbol"]
         path = params.get("path", ".")
         file_types = params.get("file_types")
-        include_definition = params.get("include_definition", True)
-
-        # Build pattern for word boundary match
-        pattern = rf'\b{re.escape(symbol)}\b'
-
-        # Find matches
-        matches = run_grep(pattern, path, file_types)
-
-        # Categorize matches
-        references: List[Dict[str, Any]] = []
-        definitions: List[Dict[str, Any]] = []
-
-        definition_patterns = [
-            rf'def\s+{re.escape(symbol)}\s*\(',  # Python function
-            rf'class\s+{re.escape(symbol)}[\s:(]',  # Python/JS class
-            rf'function\s+{re.escape(symbol)}\s*\(',  # JS function
-            rf'const\s+{re.escape(symbol)}\s*=',  # JS const
-            rf'let\s+{re.escape(symbol)}\s*=',  # JS let
-            rf'var\s+{re.escape(symbol)}\s*=',  # JS var
-            rf'func\s+{re.escape(symbol)}\s*\(',  # Go function
-            rf'type\s+{re.escape(symbol)}\s+',  # Go type
-            rf'fn\s+{re.escape(symbol)}\s*[<(]',  # Rust function
-            rf'struct\s+{re.escape(symbol)}\s*[{{<]',  # Rust/Go struct
-        ]
-
-        for match in matches:
-            content = match["content"]
-            is_definition = any(re.search(p, content) for p in definition_patterns)
 
-            if is_definition:
-                definitions.append(match)
-            else:
-                references.append(match)
-
-        # Combine results
-        if include_definition:
-            all_refs = definitions + references
-        else:
-            all_refs = references
+        definitions, references = _search_symbol(symbol, path, file_types)
 
         return ToolResult.ok(
             data={
@@ -189,7 +440,7 @@ class FindReferencesTool(BaseTool):
                 "total_references": len(references),
                 "definitions": definitions[:10],
                 "references": references[:50],
-                "files_with_references": list(set(r["file"] for r in references))[:20],
+                "files_with_references": list(dict.fromkeys(r["file"] for r in references))[:20],
             },
             summary=f"Found {len(definitions)} definition(s), {len(references)} reference(s) for '{symbol}'",
         )
@@ -228,92 +479,17 @@ class FindDefinitionTool(BaseTool):
         ),
     ]
 
-    # Definition patterns by language
-    DEFINITION_PATTERNS = {
-        "python": [
-            r'def\s+{symbol}\s*\(',
-            r'class\s+{symbol}[\s:(]',
-            r'{symbol}\s*=\s*(?!.*==)',  # Assignment (not comparison)
-        ],
-        "javascript": [
-            r'function\s+{symbol}\s*\(',
-            r'const\s+{symbol}\s*=',
-            r'let\s+{symbol}\s*=',
-            r'var\s+{symbol}\s*=',
-            r'class\s+{symbol}[\s{]',
-            r'{symbol}\s*:\s*function',
-            r'{symbol}\s*=\s*\([^)]*\)\s*=>',
-        ],
-        "typescript": [
-            r'function\s+{symbol}\s*[<(]',
-            r'const\s+{symbol}\s*[:<]?\s*=',
-            r'let\s+{symbol}\s*[:<]?\s*=',
-            r'class\s+{symbol}[\s<{]',
-            r'interface\s+{symbol}[\s<{]',
-            r'type\s+{symbol}\s*[<=]',
-        ],
-        "go": [
-            r'func\s+{symbol}\s*\(',
-            r'func\s+\([^)]+\)\s+{symbol}\s*\(',  # Method
-            r'type\s+{symbol}\s+',
-            r'var\s+{symbol}\s+',
-            r'const\s+{symbol}\s*=',
-        ],
-        "rust": [
-            r'fn\s+{symbol}\s*[<(]',
-            r'struct\s+{symbol}[\s<{]',
-            r'enum\s+{symbol}[\s<{]',
-            r'trait\s+{symbol}[\s<{]',
-            r'type\s+{symbol}\s*=',
-            r'const\s+{symbol}\s*:',
-            r'static\s+{symbol}\s*:',
-        ],
-    }
-
     def execute(self, **params) -> ToolResult:
         """Find definition."""
         symbol = params["symbol"]
         path = params.get("path", ".")
         file_types = params.get("file_types")
 
-        definitions: List[Dict[str, Any]] = []
+        # Only source files of the known languages by default, so text in
+        # docs isn't taken for a definition
+        definitions, _ = _search_symbol(symbol, path, file_types or _DEFINITION_EXTENSIONS)
 
-        # Try each language's definition patterns
-        for lang, patterns in self.DEFINITION_PATTERNS.items():
-            # Map language to file types
-            lang_types = {
-                "python": ["py"],
-                "javascript": ["js", "jsx", "mjs"],
-                "typescript": ["ts", "tsx"],
-                "go": ["go"],
-                "rust": ["rs"],
-            }
-
-            search_types = file_types or lang_types.get(lang, [])
-
-            for pattern_template in patterns:
-                pattern = pattern_template.format(symbol=re.escape(symbol))
-                matches = run_grep(pattern, path, search_types, context=2)
-
-                for match in matches:
-                    # Verify it's actually a definition
-                    if self._is_definition(match["content"], symbol, lang):
-                        definitions.append({
-                            **match,
-                            "language": lang,
-                            "type": self._get_definition_type(match["content"], symbol, lang),
-                        })
-
-        # Deduplicate
-        seen = set()
-        unique_defs = []
-        for d in definitions:
-            key = (d["file"], d["line"])
-            if key not in seen:
-                seen.add(key)
-                unique_defs.append(d)
-
-        if not unique_defs:
+        if not definitions:
             return ToolResult.ok(
                 data={
                     "symbol": symbol,
@@ -327,51 +503,12 @@ class FindDefinitionTool(BaseTool):
             data={
                 "symbol": symbol,
                 "found": True,
-                "definitions": unique_defs[:10],
-                "primary_definition": unique_defs[0] if unique_defs else None,
+                "definitions": definitions[:10],
+                "primary_definition": definitions[0],
             },
-            summary=f"Found {len(unique_defs)} definition(s) for '{symbol}' in {unique_defs[0]['file']}:{unique_defs[0]['line']}",
+            summary=f"Found {len(definitions)} definition(s) for '{symbol}' in {definitions[0]['file']}:{definitions[0]['line']}",
         )
 
-    def _is_definition(self, content: str, symbol: str, language: str) -> bool:
-        """Verify content is actually a definition."""
-        # Check it's not just a usage
-        usage_patterns = [
-            rf'{symbol}\s*\(',  # Function call
-            rf'\.{symbol}',  # Method call
-            rf'import.*{symbol}',  # Import
-        ]
-
-        # Definition markers by language
-        def_markers = {
-            "python": ["def ", "class "],
-            "javascript": ["function ", "const ", "let ", "var ", "class "],
-            "typescript": ["function ", "const ", "let ", "class ", "interface ", "type "],
-            "go": ["func ", "type ", "var ", "const "],
-            "rust": ["fn ", "struct ", "enum ", "trait ", "type ", "const ", "static "],
-        }
-
-        markers = def_markers.get(language, [])
-        return any(marker in content for marker in markers)
-
-    def _get_definition_type(self, content: str, symbol: str, language: str) -> str:
-        """Determine what type of definition this is."""
-        type_markers = {
-            "function": ["def ", "func ", "fn ", "function "],
-            "class": ["class "],
-            "struct": ["struct "],
-            "interface": ["interface ", "trait "],
-            "type": ["type "],
-            "variable": ["const ", "let ", "var ", "static "],
-            "enum": ["enum "],
-        }
-
-        for def_type, markers in type_markers.items():
-            if any(marker in content for marker in markers):
-                return def_type
-
-        return "unknown"
-
 
 @register_tool
 class AnalyzeImportsTool(BaseTool):
@@ -450,7 +587,7 @@ class AnalyzeImportsTool(BaseTool):
                 "total_imports": len(imports),
                 "local_imports": local_imports,
                 "external_imports": external_imports,
-                "dependencies": list(set(i["module"].split(".")[0] for i in external_imports)),
+                "dependencies": list(dict.fromkeys(i["module"].split(".")[0] for i in external_imports)),
             },
             summary=f"Found {len(imports)} imports ({len(local_imports)} local, {len(external_imports)} external)",
         )
@@ -460,13 +597,10 @@ class AnalyzeImportsTool(BaseTool):
         all_imports: Dict[str, int] = {}
         files_analyzed = 0
 
-        for root, _, files in os.walk(dir_path):
-            for filename in files:
-                ext = get_file_extension(filename)
-                if ext not in ['py', 'js', 'ts', 'jsx', 'tsx']:
-                    continue
+        files_by_ext = _path_index.files_by_ext(dir_path)
 
-                file_path = os.path.join(root, filename)
+        for ext in ['py', 'js', 'ts', 'jsx', 'tsx']:
+            for file_path in files_by_ext.get(ext, []):
                 try:
                     with open(file_path, 'r', encoding='utf-8') as f:
                         content = f.read()
@@ -587,11 +721,12 @@ class DeadCodeCheckTool(BaseTool):
 
             for pattern_info in def_patterns:
                 matches = run_grep(pattern_info["pattern"], path, [ft])
+                extract = re.compile(pattern_info["extract"])
 
                 for match in matches:
                     # Extract symbol name
                     content = match["content"]
-                    symbol_match = re.search(pattern_info["extract"], content)
+                    symbol_match = extract.search(content)
                     if symbol_match:
                         definitions.append({
                             "symbol": symbol_match.group(1),
@@ -600,22 +735,24 @@ class DeadCodeCheckTool(BaseTool):
                             "line": match["line"],
                         })
 
-        # Check each definition for references
-        potentially_unused: List[Dict[str, Any]] = []
-
-        for defn in definitions:
-            symbol = defn["symbol"]
+        # Skip common patterns that are always "used"
+        candidates = [
+            defn for defn in definitions
+            if not (defn["symbol"].startswith('_')
+                    or defn["symbol"] in ['__init__', 'main', 'setUp', 'tearDown'])
+        ]
 
-            # Skip common patterns that are always "used"
-            if symbol.startswith('_') or symbol in ['__init__', 'main', 'setUp', 'tearDown']:
-                continue
+        # Count references for every symbol in a single search
+        occurrences = count_word_occurrences(
+            [defn["symbol"] for defn in candidates], path, file_types
+        )
 
-            # Count references
-            pattern = rf'\b{re.escape(symbol)}\b'
-            matches = run_grep(pattern, path, file_types)
+        # Check each definition for references
+        potentially_unused: List[Dict[str, Any]] = []
 
+        for defn in candidates:
             # Subtract 1 for the definition itself
-            reference_count = len(matches) - 1
+            reference_count = occurrences[defn["symbol"]] - 1
 
             if reference_count <= 0:
                 potentially_unused.append({
@@ -11,10 +11,18 @@ Safety requirements:
 - Create backup before patching
 """
 
+import errno
+import itertools
+import mmap
 import os
 import shutil
-from datetime import datetime
-from typing import Optional, Tuple
+import stat
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable, Iterator, Optional, Tuple, Union
 
 from .base import BaseTool, ToolResult, ToolParam, ToolCategory, register_tool
 
@@ -24,6 +32,186 @@ class PatchError(Exception):
     pass
 
 
+# Per-process sequence number for backup file names
+_BACKUP_SEQ = itertools.count(1)
+
+# Copies backups that cannot be hard-linked off the patching thread
+_BACKUP_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ephraim-backup")
+
+# os.link errors meaning the backup can't be a hard link, so it is copied
+_LINK_UNSUPPORTED = frozenset({
+    errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP,
+})
+
+
+def _wait_for_backup(pending: Future) -> None:
+    """Block until a background backup copy is done."""
+    try:
+        pending.result()
+    except Exception as e:
+        raise PatchError(f"Failed to create backup file: {str(e)}") from e
+
+
+@contextmanager
+def _map_file(path: str) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Map a file read-only so it can be searched without reading it.
+
+    Empty files cannot be mapped and are yielded as b''. The mapping must
+    be released before the file is rewritten.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+# Length of the find-string prefix used to pre-filter long patterns
+_ANCHOR_LEN = 64
+
+
+def _find(content: Union[mmap.mmap, bytes], needle: bytes, start: int = 0) -> int:
+    """
+    Find needle in content, starting at start.
+
+    Long needles are anchored on their first bytes: if the anchor does not
+    occur the needle cannot either, and otherwise the full search starts
+    at the anchor's first occurrence.
+    """
+    if len(needle) > _ANCHOR_LEN:
+        start = content.find(needle[:_ANCHOR_LEN], start)
+        if start == -1:
+            return -1
+    return content.find(needle, start)
+
+
+def _locate(content: Union[mmap.mmap, bytes], find_b: bytes) -> Tuple[int, int]:
+    """
+    Locate the single occurrence of find_b in content.
+
+    Returns (position, count). Counting stops at one match unless a second
+    one makes the patch ambiguous, in which case all matches are counted.
+    """
+    pos = _find(content, find_b)
+    if pos == -1:
+        return -1, 0
+
+    count = 1
+    nxt = _find(content, find_b, pos + len(find_b))
+    while nxt != -1:
+        count += 1
+        nxt = _find(content, find_b, nxt + len(find_b))
+
+    return pos, count
+
+
+def _atomic_write(
+    path: str,
+    data: Union[bytes, bytearray],
+    before_replace: Optional[Callable[[], None]] = None,
+) -> None:
+    """
+    Replace a file's content atomically.
+
+    The data is written and fsynced to a temporary file in the same
+    directory, which is then renamed over the target. A failure at any
+    point leaves the original file untouched. Symlinks are resolved so
+    the link target is updated rather than the link replaced.
+
+    before_replace runs just before the rename; if it raises, the target
+    is left untouched as well.
+    """
+    target = os.path.realpath(path)
+    fd, tmp = tempfile.mkstemp(
+        prefix=os.path.basename(target) + '.',
+        suffix='.tmp',
+        dir=os.path.dirname(target),
+    )
+    try:
+        try:
+            # The whole buffer is in memory: hand it to the kernel directly,
+            # normally in a single write(2)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        shutil.copymode(target, tmp)
+        if before_replace is not None:
+            before_replace()
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _count_newlines(content: Union[mmap.mmap, bytes], end: int, chunk: int = 1 << 20) -> int:
+    """Count newlines in content[:end], copying at most one chunk at a time."""
+    return sum(
+        content[i:min(i + chunk, end)].count(b'\n')
+        for i in range(0, end, chunk)
+    )
+
+
+def _window_bounds(
+    content: Union[mmap.mmap, bytes],
+    pos: int,
+    end_pos: int,
+    ctx: int,
+) -> Tuple[int, int]:
+    """
+    Get byte offsets of the lines spanning content[pos:end_pos] plus ctx
+    lines of context on each side.
+    """
+    # Walk back to the start of the line ctx lines before the match
+    start = content.rfind(b'\n', 0, pos) + 1
+    for _ in range(ctx):
+        if start == 0:
+            break
+        start = content.rfind(b'\n', 0, start - 1) + 1
+
+    # Walk forward to the end of the line ctx lines after the match
+    end = content.find(b'\n', end_pos)
+    for _ in range(ctx):
+        if end == -1:
+            break
+        end = content.find(b'\n', end + 1)
+    if end == -1:
+        end = len(content)
+
+    return start, end
+
+
+def _encode_patch(content: Union[mmap.mmap, bytes], find_str: str, replace_str: str) -> Tuple[bytes, bytes]:
+    """
+    Encode find/replace strings to match the raw file content.
+
+    Files are patched as bytes, so for files using CRLF line endings the
+    patch strings are converted to CRLF as well. Multi-line patches then
+    still match and the file keeps its line endings.
+    """
+    find_b = find_str.encode('utf-8')
+    replace_b = replace_str.encode('utf-8')
+
+    newline = content.find(b'\n')
+    if newline > 0 and content[newline - 1:newline] == b'\r':
+        find_b = find_b.replace(b'\r\n', b'\n').replace(b'\n', b'\r\n')
+        replace_b = replace_b.replace(b'\r\n', b'\n').replace(b'\n', b'\r\n')
+
+    return find_b, replace_b
+
+
+def _decode_line(line: bytes) -> str:
+    """Decode a raw file line for display."""
+    return line.decode('utf-8', errors='replace').rstrip('\r')
+
+
 @register_tool
 class ApplyPatchTool(BaseTool):
     """
@@ -86,16 +274,17 @@ class ApplyPatchTool(BaseTool):
         if validation_error:
             return ToolResult.fail(validation_error)
 
-        # Read the file
+        # Map the file as bytes; nothing is copied unless the patch applies
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with _map_file(path) as content:
+                find_b, replace_b = _encode_patch(content, find_str, replace_str)
+                pos, count = _locate(content, find_b)
+                if count == 1:
+                    # Single copy of the file, spliced in place below
+                    new_content = bytearray(content)
         except Exception as e:
             return ToolResult.fail(f"Failed to read file: {str(e)}")
 
-        # Count occurrences
-        count = content.count(find_str)
-
         if count == 0:
             return ToolResult.fail(
                 f"Pattern not found in file.\n"
@@ -111,31 +300,42 @@ class ApplyPatchTool(BaseTool):
 
         # Create backup if requested
         backup_path = None
+        pending_backup = None
         if create_backup:
-            backup_path = self._create_backup(path)
-            if backup_path is None:
+            backup = self._create_backup(path)
+            if backup is None:
                 return ToolResult.fail("Failed to create backup file")
+            backup_path, pending_backup = backup
 
         # Apply the patch
-        new_content = content.replace(find_str, replace_str, 1)
+        new_content[pos:pos + len(find_b)] = replace_b
 
-        # Write the result
+        # Write the result (atomically, the original stays intact on failure).
+        # A backup still being copied is awaited before the file is replaced.
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            _atomic_write(
+                path,
+                new_content,
+                before_replace=(
+                    partial(_wait_for_backup, pending_backup)
+                    if pending_backup is not None else None
+                ),
+            )
+        except PatchError as e:
+            return ToolResult.fail(str(e))
         except Exception as e:
-            # Try to restore from backup
-            if backup_path and os.path.exists(backup_path):
-                shutil.copy2(backup_path, path)
             return ToolResult.fail(f"Failed to write file: {str(e)}")
 
-        # Calculate diff info
-        find_lines = find_str.count('\n') + 1
-        replace_lines = replace_str.count('\n') + 1
+        # Calculate diff info (single-line patches need no counting)
+        if '\n' in find_str or '\n' in replace_str:
+            find_lines = find_str.count('\n') + 1
+            replace_lines = replace_str.count('\n') + 1
+        else:
+            find_lines = replace_lines = 1
         line_diff = replace_lines - find_lines
 
         # Find the line number of the change
-        line_number = content[:content.find(find_str)].count('\n') + 1
+        line_number = new_content.count(b'\n', 0, pos) + 1
 
         return ToolResult.ok(
             data={
@@ -164,19 +364,21 @@ class ApplyPatchTool(BaseTool):
         Returns error message or None if valid.
         """
         # Check file exists
-        if not os.path.exists(path):
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
             return f"File not found: {path}"
+        except OSError as e:
+            return f"Cannot access file: {path} ({e})"
 
         # Check it's a file
-        if not os.path.isfile(path):
+        if not stat.S_ISREG(st.st_mode):
             return f"Not a file: {path}"
 
-        # Check file is readable
-        if not os.access(path, os.R_OK):
-            return f"File not readable: {path}"
-
-        # Check file is writable
-        if not os.access(path, os.W_OK):
+        # Check file is readable and writable (one check in the common case)
+        if not os.access(path, os.R_OK | os.W_OK):
+            if not os.access(path, os.R_OK):
+                return f"File not readable: {path}"
             return f"File not writable: {path}"
 
         # Check find string is not empty
@@ -189,11 +391,13 @@ class ApplyPatchTool(BaseTool):
 
         return None
 
-    def _create_backup(self, path: str) -> Optional[str]:
+    def _create_backup(self, path: str) -> Optional[Tuple[str, Optional[Future]]]:
         """
         Create a backup of the file.
 
-        Returns the backup path or None if failed.
+        Returns (backup_path, pending) or None if failed. pending is the
+        background copy when the file could not be hard-linked; it must
+        complete before the file is modified.
         """
         try:
             # Create backup directory
@@ -202,13 +406,25 @@ class ApplyPatchTool(BaseTool):
 
             # Generate backup filename with timestamp
             filename = os.path.basename(path)
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_filename = f"{filename}.{timestamp}.bak"
+            # (pid and sequence number keep same-second backups distinct)
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
+            backup_filename = f"{filename}.{timestamp}.{os.getpid()}_{next(_BACKUP_SEQ)}.bak"
             backup_path = os.path.join(backup_dir, backup_filename)
 
-            # Copy the file
-            shutil.copy2(path, backup_path)
-            return backup_path
+            # Hard-link the file: patches are written with os.replace, so
+            # the backup keeps the original inode at no copying cost. A
+            # symlink is resolved first, so the backup is its target and not
+            # a (possibly relative, now dangling) link. Where links are
+            # unsupported, copy in the background while the patched content
+            # is being written.
+            source = os.path.realpath(path)
+            try:
+                os.link(source, backup_path)
+            except OSError as e:
+                if e.errno not in _LINK_UNSUPPORTED:
+                    raise
+                return backup_path, _BACKUP_POOL.submit(shutil.copy2, source, backup_path)
+            return backup_path, None
 
         except Exception:
             return None
@@ -221,64 +437,71 @@ class ApplyPatchTool(BaseTool):
         return text[:max_length] + "..."
 
 
-def preview_patch(
-    path: str,
-    find_str: str,
-    replace_str: str,
-    context_lines: int = 3,
-) -> Tuple[bool, str]:
+def can_apply_patch(path: str, find_str: str) -> Tuple[bool, Optional[str], Optional[int]]:
     """
-    Preview a patch without applying it.
+    Check whether a patch would apply, without rendering a preview.
 
     Returns:
-        Tuple of (can_apply, preview_text)
+        Tuple of (can_apply, error, position) where position is the byte
+        offset of the unique match
     """
     path = os.path.abspath(os.path.expanduser(path))
 
     if not os.path.exists(path):
-        return False, f"File not found: {path}"
+        return False, f"File not found: {path}", None
 
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with _map_file(path) as content:
+            find_b, _ = _encode_patch(content, find_str, "")
+            pos, count = _locate(content, find_b)
     except Exception as e:
-        return False, f"Failed to read file: {str(e)}"
-
-    count = content.count(find_str)
+        return False, f"Failed to read file: {str(e)}", None
 
     if count == 0:
-        return False, "Pattern not found in file"
+        return False, "Pattern not found in file", None
 
     if count > 1:
-        return False, f"Ambiguous: found {count} occurrences"
-
-    # Find position and line number
-    pos = content.find(find_str)
-    lines = content.split('\n')
-    line_count = 0
-    char_count = 0
-
-    for i, line in enumerate(lines):
-        char_count += len(line) + 1  # +1 for newline
-        if char_count > pos:
-            line_count = i
-            break
+        return False, f"Ambiguous: found {count} occurrences", None
+
+    return True, None, pos
+
+
+def render_patch_preview(
+    path: str,
+    find_str: str,
+    replace_str: str,
+    pos: int,
+    context_lines: int = 3,
+) -> str:
+    """
+    Render a diff-style preview of a patch whose match is at byte offset pos.
+
+    Only the lines around the match are read from the file.
+    """
+    path = os.path.abspath(os.path.expanduser(path))
+
+    with _map_file(path) as content:
+        find_b, _ = _encode_patch(content, find_str, replace_str)
+        line_count = _count_newlines(content, pos)
+        start, end = _window_bounds(content, pos, pos + len(find_b), context_lines)
+        window = content[start:end]
+        before_count = window.count(b'\n', 0, pos - start)
 
-    # Get context
-    start_line = max(0, line_count - context_lines)
-    end_line = min(len(lines), line_count + find_str.count('\n') + context_lines + 1)
+    lines = window.split(b'\n')
+    start_line = line_count - before_count
 
     preview_lines = []
     preview_lines.append(f"--- {path} (original)")
     preview_lines.append(f"+++ {path} (patched)")
-    preview_lines.append(f"@@ -{start_line + 1},{end_line - start_line} @@")
+    preview_lines.append(f"@@ -{start_line + 1},{len(lines)} @@")
 
     # Show before context
-    for i in range(start_line, line_count):
-        preview_lines.append(f"  {lines[i]}")
+    for line in lines[:before_count]:
+        preview_lines.append(f"  {_decode_line(line)}")
 
     # Show removed lines
-    for line in find_str.split('\n'):
+    find_split = find_str.split('\n')
+    for line in find_split:
         preview_lines.append(f"- {line}")
 
     # Show added lines
@@ -286,9 +509,30 @@ def preview_patch(
         preview_lines.append(f"+ {line}")
 
     # Show after context
-    after_start = line_count + find_str.count('\n') + 1
-    for i in range(after_start, end_line):
-        if i < len(lines):
-            preview_lines.append(f"  {lines[i]}")
+    after_start = before_count + len(find_split)
+    for line in lines[after_start:]:
+        preview_lines.append(f"  {_decode_line(line)}")
+
+    return '\n'.join(preview_lines)
+
+
+def preview_patch(
+    path: str,
+    find_str: str,
+    replace_str: str,
+    context_lines: int = 3,
+) -> Tuple[bool, str]:
+    """
+    Preview a patch without applying it.
+
+    Returns:
+        Tuple of (can_apply, preview_text)
+    """
+    can_apply, error, pos = can_apply_patch(path, find_str)
+    if not can_apply:
+        return False, error
 
-    return True, '\n'.join(preview_lines)
+    try:
+        return True, render_patch_preview(path, find_str, replace_str, pos, context_lines)
+    except Exception as e:
+        return False, f"Failed to read file: {str(e)}"
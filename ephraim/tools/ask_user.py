@@ -10,13 +10,6 @@ Handles user interaction for:
 from typing import Optional
 
 from .base import BaseTool, ToolResult, ToolParam, ToolCategory, register_tool
-from ..logging_setup import (
-    print_approval_request,
-    print_separator,
-    confirm,
-    get_user_input,
-    console,
-)
 
 
 @register_tool
@@ -66,6 +59,10 @@ class AskUserTool(BaseTool):
 
     def execute(self, **params) -> ToolResult:
         """Present the question to the user and get response."""
+        # Imported here (and in the handlers) so importing the tools
+        # package doesn't load rich
+        from ..logging_setup import print_separator, console
+
         question = params["question"]
         request_type = params.get("request_type", "approval")
         options = params.get("options")
@@ -88,6 +85,8 @@ class AskUserTool(BaseTool):
 
     def _handle_approval(self, question: str) -> ToolResult:
         """Handle approval request (yes/no)."""
+        from ..logging_setup import print_approval_request, confirm
+
         print_approval_request(question)
 
         try:
@@ -115,6 +114,8 @@ class AskUserTool(BaseTool):
         options: Optional[list],
     ) -> ToolResult:
         """Handle clarification request (free text or multiple choice)."""
+        from ..logging_setup import get_user_input, console
+
         console.print(f"\n[yellow]Clarification needed:[/yellow]")
         console.print(question)
 
@@ -181,6 +182,8 @@ class AskUserTool(BaseTool):
 
     def _handle_confirmation(self, question: str) -> ToolResult:
         """Handle simple confirmation (yes/no)."""
+        from ..logging_setup import confirm, console
+
         console.print(f"\n[yellow]{question}[/yellow]")
 
         try:
@@ -7,10 +7,68 @@ Tools must be testable independently without the LLM.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Sequence, Tuple
 from enum import Enum
 
 
+# Parameter type name -> (expected Python type, description for errors)
+_TYPE_CHECKS = {
+    "string": (str, "a string"),
+    "int": (int, "an integer"),
+    "bool": (bool, "a boolean"),
+    "list": (list, "a list"),
+    "dict": (dict, "a dictionary"),
+}
+
+
+def compile_validator(parameters: Sequence["ToolParam"]) -> Callable[[Dict[str, Any]], Optional[str]]:
+    """
+    Generate a straight-line validator for a fixed parameter list.
+
+    The generated function performs the same checks as
+    BaseTool.validate_params, unrolled into one statement per parameter
+    so no ToolParam attributes or type tables are consulted per call.
+    Defaults for absent parameters are filled into params in the same
+    pass; on failure params may be partially filled.
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def _validate(params):"]
+
+    # One block per parameter, in declaration order, so the first error
+    # reported is the same as validate_params'
+    for i, param in enumerate(parameters):
+        if param.required:
+            lines.append(f"    if {param.name!r} not in params:")
+            lines.append(f"        return {'Missing required parameter: ' + param.name!r}")
+        check = _TYPE_CHECKS.get(param.type)
+        has_default = param.default is not None
+        if has_default:
+            namespace[f"_d{i}"] = param.default
+        if check is None:
+            if has_default:
+                lines.append(f"    if {param.name!r} not in params:")
+                lines.append(f"        params[{param.name!r}] = _d{i}")
+            continue
+        namespace[f"_t{i}"] = check[0]
+        message = f"Parameter '{param.name}' must be {check[1]}"
+        if param.required:
+            lines.append(f"    if not isinstance(params[{param.name!r}], _t{i}):")
+            lines.append(f"        return {message!r}")
+            continue
+        # None optional parameters are not type checked
+        lines.append(f"    if {param.name!r} in params:")
+        lines.append(f"        v = params[{param.name!r}]")
+        lines.append(f"        if v is not None and not isinstance(v, _t{i}):")
+        lines.append(f"            return {message!r}")
+        if has_default:
+            lines.append("    else:")
+            lines.append(f"        params[{param.name!r}] = _d{i}")
+
+    lines.append("    return None")
+    exec("\n".join(lines), namespace)
+    return namespace["_validate"]
+
+
 class ToolCategory(Enum):
     """Categories of tools for phase enforcement."""
     READ_ONLY = "read_only"      # Can run in any phase
@@ -20,7 +78,7 @@ class ToolCategory(Enum):
     CI = "ci"                    # CI/CD operations
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """
     Standardized result from tool execution.
@@ -46,8 +104,20 @@ class ToolResult:
     context_for_next: Dict[str, Any] = field(default_factory=dict)
     error_type: str = ""  # not_found, permission, validation, etc.
 
+    # Serialized form, built on first to_dict() (results are not modified
+    # after construction)
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
+        if self._cached_dict is None:
+            self._cached_dict = self._build_dict()
+        return self._cached_dict
+
+    def _build_dict(self) -> Dict[str, Any]:
+        """Build the serialized form."""
         return {
             "success": self.success,
             "data": self.data,
@@ -98,7 +168,7 @@ class ToolResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolParam:
     """Definition of a tool parameter."""
     name: str
@@ -123,7 +193,34 @@ class BaseTool(ABC):
     name: str = ""
     description: str = ""
     category: ToolCategory = ToolCategory.READ_ONLY
-    parameters: List[ToolParam] = []
+    parameters: Tuple[ToolParam, ...] = ()
+
+    # Generated by register_tool (see compile_validator); also fills defaults
+    _validate: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None
+
+    # Derived from the class attributes in __init_subclass__
+    _defaults: Dict[str, Any] = {}
+    _type_map: Dict[str, Tuple[type, str]] = {}
+    _requires_approval: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        """Precompute parameter tables and approval flag for each tool class."""
+        super().__init_subclass__(**kwargs)
+        # Subclasses may declare a list; freeze it so it can't be mutated
+        # (and shared) through the class
+        cls.parameters = tuple(cls.parameters)
+        cls._defaults = {
+            p.name: p.default for p in cls.parameters if p.default is not None
+        }
+        cls._type_map = {
+            p.name: _TYPE_CHECKS[p.type]
+            for p in cls.parameters
+            if p.type in _TYPE_CHECKS
+        }
+        cls._requires_approval = cls.category in (
+            ToolCategory.EXECUTION,
+            ToolCategory.GIT,
+        )
 
     def __init__(self):
         """Initialize the tool."""
@@ -131,7 +228,21 @@ class BaseTool(ABC):
             raise ValueError(f"Tool {self.__class__.__name__} must define 'name'")
 
     def get_schema(self) -> Dict[str, Any]:
-        """Get the tool schema for LLM context."""
+        """
+        Get the tool schema for LLM context.
+
+        The schema only depends on class attributes, so it is built once
+        per tool class and shared by its instances.
+        """
+        cls = type(self)
+        schema = cls.__dict__.get("_schema_cache")
+        if schema is None:
+            schema = self._build_schema()
+            cls._schema_cache = schema
+        return schema
+
+    def _build_schema(self) -> Dict[str, Any]:
+        """Build the tool schema from the class attributes."""
         return {
             "name": self.name,
             "description": self.description,
@@ -155,27 +266,24 @@ class BaseTool(ABC):
         Returns None if valid, error message if invalid.
         """
         for param in self.parameters:
-            if param.required and param.name not in params:
-                return f"Missing required parameter: {param.name}"
-
-            if param.name in params:
-                value = params[param.name]
-
-                # Skip type checking for None values on optional parameters
-                if value is None and not param.required:
-                    continue
-
-                # Type checking
-                if param.type == "string" and not isinstance(value, str):
-                    return f"Parameter '{param.name}' must be a string"
-                elif param.type == "int" and not isinstance(value, int):
-                    return f"Parameter '{param.name}' must be an integer"
-                elif param.type == "bool" and not isinstance(value, bool):
-                    return f"Parameter '{param.name}' must be a boolean"
-                elif param.type == "list" and not isinstance(value, list):
-                    return f"Parameter '{param.name}' must be a list"
-                elif param.type == "dict" and not isinstance(value, dict):
-                    return f"Parameter '{param.name}' must be a dictionary"
+            name = param.name
+            if name not in params:
+                if param.required:
+                    return f"Missing required parameter: {name}"
+                continue
+
+            check = self._type_map.get(name)
+            if check is None:
+                continue
+
+            value = params[name]
+
+            # Skip type checking for None values on optional parameters
+            if value is None and not param.required:
+                continue
+
+            if not isinstance(value, check[0]):
+                return f"Parameter '{name}' must be {check[1]}"
 
         return None
 
@@ -185,15 +293,17 @@ class BaseTool(ABC):
 
         This is the main entry point for tool execution.
         """
-        # Validate parameters
-        error = self.validate_params(**params)
-        if error:
-            return ToolResult.fail(error)
-
-        # Apply defaults
-        for param in self.parameters:
-            if param.name not in params and param.default is not None:
-                params[param.name] = param.default
+        # Validate parameters and apply defaults
+        if self._validate is not None:
+            error = self._validate(params)
+            if error:
+                return ToolResult.fail(error)
+        else:
+            error = self.validate_params(**params)
+            if error:
+                return ToolResult.fail(error)
+            for name, default in self._defaults.items():
+                params.setdefault(name, default)
 
         # Execute
         try:
@@ -213,41 +323,100 @@ class BaseTool(ABC):
 
     def requires_approval(self) -> bool:
         """Check if this tool requires user approval."""
-        return self.category in (
-            ToolCategory.EXECUTION,
-            ToolCategory.GIT,
-        )
+        return self._requires_approval
 
 
 class ToolRegistry:
     """
     Registry of available tools.
 
-    Provides lookup and listing functionality.
+    Provides lookup and listing functionality. Tools can be registered
+    as factories, which are only invoked on first use; the name,
+    description and category are kept alongside so listings by category
+    do not construct tools.
     """
 
     def __init__(self):
+        self._summaries: Dict[str, Dict[str, Any]] = {}
+        self._factories: Dict[str, Callable[[], BaseTool]] = {}
         self._tools: Dict[str, BaseTool] = {}
 
     def register(self, tool: BaseTool) -> None:
         """Register a tool."""
+        self._summaries[tool.name] = self._summary(tool.name, tool.description, tool.category)
+        self._factories.pop(tool.name, None)
         self._tools[tool.name] = tool
 
+    def register_factory(
+        self,
+        name: str,
+        factory: Callable[[], BaseTool],
+        description: str = "",
+        category: ToolCategory = ToolCategory.READ_ONLY,
+    ) -> None:
+        """Register a factory that builds the tool on first use."""
+        self._summaries[name] = self._summary(name, description, category)
+        self._factories[name] = factory
+        self._tools.pop(name, None)
+
+    def register_class(self, tool_class: type) -> None:
+        """Register a tool class, deferring instantiation to first use."""
+        if not tool_class.name:
+            raise ValueError(f"Tool {tool_class.__name__} must define 'name'")
+        self.register_factory(
+            tool_class.name,
+            tool_class,
+            description=tool_class.description,
+            category=tool_class.category,
+        )
+
     def get(self, name: str) -> Optional[BaseTool]:
         """Get a tool by name."""
-        return self._tools.get(name)
+        tool = self._tools.get(name)
+        if tool is None:
+            factory = self._factories.pop(name, None)
+            if factory is not None:
+                tool = self._tools[name] = factory()
+        return tool
 
     def list_all(self) -> List[BaseTool]:
         """List all registered tools."""
-        return list(self._tools.values())
+        return [self.get(name) for name in self._summaries]
 
     def list_by_category(self, category: ToolCategory) -> List[BaseTool]:
         """List tools by category."""
-        return [t for t in self._tools.values() if t.category == category]
+        return [
+            self.get(name)
+            for name, summary in self._summaries.items()
+            if summary["category"] == category.value
+        ]
 
     def get_schemas(self) -> List[Dict[str, Any]]:
         """Get schemas for all tools (for LLM context)."""
-        return [tool.get_schema() for tool in self._tools.values()]
+        return [tool.get_schema() for tool in self.list_all()]
+
+    def get_summaries(self) -> List[Dict[str, Any]]:
+        """
+        Get the name, description and category of every tool.
+
+        Summaries are kept at registration, so this constructs no tools;
+        pair with get_full_schema() to expand only the tools needed.
+        """
+        return list(self._summaries.values())
+
+    def get_full_schema(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get the full schema (with parameters) for one tool by name."""
+        tool = self.get(name)
+        return tool.get_schema() if tool is not None else None
+
+    @staticmethod
+    def _summary(name: str, description: str, category: ToolCategory) -> Dict[str, Any]:
+        """Build the summary kept for every registered tool."""
+        return {
+            "name": name,
+            "description": description,
+            "category": category.value,
+        }
 
 
 # Global tool registry instance
@@ -255,7 +424,7 @@ tool_registry = ToolRegistry()
 
 
 def register_tool(tool_class: type) -> type:
-    """Decorator to register a tool class."""
-    instance = tool_class()
-    tool_registry.register(instance)
+    """Decorator to register a tool class (instantiated on first use)."""
+    tool_class._validate = staticmethod(compile_validator(tool_class.parameters))
+    tool_registry.register_class(tool_class)
     return tool_class
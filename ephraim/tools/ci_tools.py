@@ -9,80 +9,480 @@ Commands:
 - check_ci_result: Parse `gh run view <id>` for pass/fail
 """
 
+import asyncio
+import calendar
+import io
 import os
 import re
 import subprocess
-from typing import Dict, Any, List, Optional
-
-from .base import BaseTool, ToolResult, ToolParam, ToolCategory, register_tool
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from .base import BaseTool, ToolResult, ToolParam, ToolCategory, register_tool, tool_registry
+
+# Optional: direct GitHub REST calls over a pooled session (see gh_api_get)
+REQUESTS_AVAILABLE = False
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    pass
+
+# Prefer orjson for parsing `gh ... --json` output when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# Optional: lazy parsing of large `gh` JSON payloads (see _json_loads_lazy)
+SIMDJSON_AVAILABLE = False
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+
+# GitHub remote URL (https or ssh form) -> owner, repo
+_REPO_URL_RE = re.compile(r'github\.com[:/]([^/]+)/([^/.]+)')
+
+# Common test failure patterns, one alternative per pattern. Each
+# alternative is anchored at the start of a line and the earliest one that
+# matches the line wins, so matching it at a line start yields at most one
+# match per line. Whitespace classes exclude '\n' so no
+# match can run into the next line. Leading \S+ / \w+ runs only start at a
+# token boundary (the match found is the same, but the engine no longer
+# retries from every character inside long tokens).
+_FAIL_UNION = re.compile(
+    r'^(?:'
+    # pytest
+    r'.*?(?<!\S)(?P<pytest_name>\S+::test_\w+)[^\S\n]+(?:FAILED|ERROR)'
+    r'|.*?FAILED[^\S\n]+(?P<pytest_failed>\S+::test_\w+)'
+    # Jest
+    r'|.*?FAIL[^\S\n]+(?P<jest_name>\S+\.test\.\w+)'
+    # Generic assertion errors
+    r'|.*?(?<!\w)(?P<file>\w+\.py):(?P<line>\d+).*(?P<error>AssertionError|Error|Exception):[^\S\n]*(?P<message>.+)'
+    r')',
+    re.MULTILINE,
+)
+# Every alternative above needs one of these literals somewhere in the line,
+# so _FAIL_UNION only has to be tried on lines that contain one
+_FAIL_CANDIDATE_RE = re.compile(r'::test_|FAIL|\.py:')
+
+
+# Patterns used by AnalyzeCIFailureTool._analyze_logs. They are all
+# line-local ([^\S\n] instead of \s), so logs can be analyzed in blocks of
+# whole lines as they stream in. This means a marker at the end of a line
+# no longer takes its value from the next one: "Error:\n  message" gives
+# no detail, and "FAILED\n<test id>" no failed test.
+# Failed test names. The pytest (FAILED) and Jest (FAIL) patterns share
+# the literal prefix FAIL, so one regex finds both; only "FAIL" is
+# consumed and the rest is a lookahead, so the two kinds can still overlap
+# as they could when each pattern was scanned on its own.
+_FAIL_TEST_RE = re.compile(
+    r'FAIL(?=ED[^\S\n]+(?P<pytest>\S+::\S+)|[^\S\n]+(?P<jest>\S+\.test\.\w+))'
+)
+# Jest's check mark output
+_CHECKMARK_TEST_RE = re.compile(r'✕[^\S\n]+(\S+)')
+# Error messages
+_ERROR_LINE_RES = [
+    re.compile(p) for p in (
+        r'Error:[^\S\n]*(\S.*)',
+        r'error\[\w+\]:[^\S\n]*(\S.*)',
+        r'AssertionError:[^\S\n]*(\S.*)',
+        r'TypeError:[^\S\n]*(\S.*)',
+    )
+]
+# Any mention of an error; the summary falls back to the first such line
+_ERROR_KEYWORD_RE = re.compile(r'error|fail|exception', re.IGNORECASE)
+# file:line references (the leading \S+ only starts at a token boundary)
+_FILE_REF_RES = [
+    re.compile(p) for p in (
+        r'(?<!\S)(\S+\.(?:py|js|ts|jsx|tsx)):(\d+)',
+        r'at (\S+\.(?:py|js|ts)):(\d+)',
+    )
+]
+
+
+def _gh_env() -> Dict[str, str]:
+    """Environment for gh: no pager and no ANSI colors in captured output."""
+    return dict(os.environ, GH_PAGER='cat', NO_COLOR='1')
 
 
 def run_gh_command(
     args: List[str],
     cwd: Optional[str] = None,
     timeout: int = 60,
+    text: bool = True,
 ) -> Dict[str, Any]:
     """
     Run a gh CLI command and return result.
 
+    With text=False stdout is returned as raw bytes, for `--json` output
+    that goes straight to _json_loads (which decodes it itself); stderr is
+    always text.
+
     Returns dict with: returncode, stdout, stderr
     """
+    empty = "" if text else b""
     try:
         result = subprocess.run(
             ['gh'] + args,
             cwd=cwd or os.getcwd(),
+            env=_gh_env(),
             capture_output=True,
-            text=True,
+            text=text,
             timeout=timeout,
         )
+        stderr = result.stderr
+        if not text:
+            stderr = stderr.decode('utf-8', errors='replace')
         return {
             "returncode": result.returncode,
             "stdout": result.stdout,
-            "stderr": result.stderr,
+            "stderr": stderr,
         }
     except FileNotFoundError:
         return {
             "returncode": -1,
-            "stdout": "",
+            "stdout": empty,
             "stderr": "GitHub CLI (gh) not found. Install from https://cli.github.com/",
         }
     except subprocess.TimeoutExpired:
         return {
             "returncode": -1,
-            "stdout": "",
+            "stdout": empty,
             "stderr": "GitHub CLI command timed out",
         }
     except Exception as e:
+        return {
+            "returncode": -1,
+            "stdout": empty,
+            "stderr": str(e),
+        }
+
+
+def run_gh_command_streamed(
+    args: List[str],
+    on_line: Callable[[str], None],
+    cwd: Optional[str] = None,
+    timeout: int = 60,
+    max_chars: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Run a gh CLI command, handing each stdout line to on_line as it arrives.
+
+    Only the first max_chars characters of stdout are kept in the result,
+    so large outputs (CI logs) never sit in memory in full; on_line still
+    sees every line.
+
+    Returns dict with: returncode, stdout, stderr, truncated
+    """
+    try:
+        proc = subprocess.Popen(
+            ['gh'] + args,
+            cwd=cwd or os.getcwd(),
+            env=_gh_env(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+    except FileNotFoundError:
         return {
             "returncode": -1,
             "stdout": "",
+            "stderr": "GitHub CLI (gh) not found. Install from https://cli.github.com/",
+            "truncated": False,
+        }
+    except Exception as e:
+        return {
+            "returncode": -1,
+            "stdout": "",
+            "stderr": str(e),
+            "truncated": False,
+        }
+
+    # Drain stderr on the side so a chatty gh can't block on a full pipe
+    stderr_chunks: List[str] = []
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_chunks.append(proc.stderr.read()),
+        daemon=True,
+    )
+    stderr_reader.start()
+
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+
+    kept = io.StringIO()
+    room = max_chars if max_chars is not None else -1
+    truncated = False
+    try:
+        for line in proc.stdout:
+            if room < 0:
+                kept.write(line)
+            elif len(line) <= room:
+                kept.write(line)
+                room -= len(line)
+            else:
+                kept.write(line[:room])
+                room = 0
+                truncated = True
+            on_line(line)
+        proc.wait()
+    except Exception as e:
+        proc.kill()
+        proc.wait()
+        return {
+            "returncode": -1,
+            "stdout": kept.getvalue(),
             "stderr": str(e),
+            "truncated": truncated,
         }
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+
+    stderr_reader.join()
+    if timed_out.is_set():
+        return {
+            "returncode": -1,
+            "stdout": kept.getvalue(),
+            "stderr": "GitHub CLI command timed out",
+            "truncated": truncated,
+        }
+    return {
+        "returncode": proc.returncode,
+        "stdout": kept.getvalue(),
+        "stderr": ''.join(stderr_chunks),
+        "truncated": truncated,
+    }
+
+
+class _ScanWindow:
+    """
+    Pass the head and a bounded tail of a streamed log on to a consumer.
+
+    Failures are usually reported at the end of a log, with the odd setup
+    error at the start, so only the first HEAD_CHARS characters and the
+    last max_tail_chars characters after them are scanned; lines in
+    between are dropped. Call flush() once the stream has ended.
+    """
+
+    HEAD_CHARS = 65536
+
+    def __init__(self, consume: Callable[[str], None], max_tail_chars: int):
+        self._consume = consume
+        self._max_tail = max_tail_chars
+        self._head_left = self.HEAD_CHARS
+        self._tail: Deque[str] = deque()
+        self._tail_size = 0
+
+    def add(self, line: str) -> None:
+        """Take the next line of the log."""
+        if self._head_left > 0:
+            self._head_left -= len(line)
+            self._consume(line)
+            return
+        self._tail.append(line)
+        self._tail_size += len(line)
+        while self._tail_size > self._max_tail and self._tail:
+            self._tail_size -= len(self._tail.popleft())
+
+    def flush(self) -> None:
+        """Pass on the retained tail."""
+        while self._tail:
+            self._consume(self._tail.popleft())
+        self._tail_size = 0
+
+
+def _json_loads_lazy(data: bytes) -> Any:
+    """
+    Parse JSON whose values are read with .get() and iteration only.
+
+    With simdjson the document is indexed but values only become Python
+    objects as they are read, which pays off for payloads where a few
+    fields of a large blob are used. Otherwise it's _json_loads.
+    """
+    if SIMDJSON_AVAILABLE:
+        # A parser's documents are only valid until its next parse, so
+        # each call gets its own
+        return simdjson.Parser().parse(data)
+    return _json_loads(data)
+
+
+def _parse_gh_ts(ts: str) -> float:
+    """Parse a gh timestamp (ISO 8601, usually with a 'Z' suffix) to epoch seconds."""
+    if len(ts) == 20 and ts[10] == 'T' and ts[19] == 'Z':
+        # GitHub's fixed YYYY-MM-DDTHH:MM:SSZ form; slice it rather than
+        # building datetime objects
+        return calendar.timegm((
+            int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+            int(ts[11:13]), int(ts[14:16]), int(ts[17:19]),
+        ))
+    if ts.endswith('Z'):
+        # fromisoformat only accepts 'Z' from Python 3.11
+        ts = ts[:-1] + '+00:00'
+    return datetime.fromisoformat(ts).timestamp()
+
+
+@lru_cache(maxsize=32)
+def _get_repo_info_cached(abs_cwd: str) -> Tuple[str, str]:
+    """
+    Look up (owner, repo) for the origin remote of abs_cwd.
+
+    The origin URL doesn't change during a session, so results are kept
+    per directory. Errors propagate and are therefore not cached.
+    """
+    result = subprocess.run(
+        ['git', 'remote', 'get-url', 'origin'],
+        cwd=abs_cwd,
+        capture_output=True,
+        text=True,
+        timeout=5,
+    )
+    if result.returncode == 0:
+        url = result.stdout.strip()
+        # Parse GitHub URL
+        match = _REPO_URL_RE.search(url)
+        if match:
+            return match.group(1), match.group(2)
+    return "", ""
 
 
 def get_repo_info(cwd: Optional[str] = None) -> Dict[str, str]:
     """Get repository owner and name from git remote."""
     try:
-        result = subprocess.run(
-            ['git', 'remote', 'get-url', 'origin'],
-            cwd=cwd or os.getcwd(),
-            capture_output=True,
-            text=True,
-            timeout=5,
+        owner, repo = _get_repo_info_cached(os.path.abspath(cwd or os.getcwd()))
+    except Exception:
+        owner, repo = "", ""
+    return {"owner": owner, "repo": repo}
+
+
+# Lookups are cached per directory (see _get_repo_info_cached); call this
+# after changing a repository's origin remote
+get_repo_info.cache_clear = _get_repo_info_cached.cache_clear
+
+
+_GH_API_URL = "https://api.github.com"
+_gh_session = None
+
+
+@lru_cache(maxsize=1)
+def _get_gh_token() -> str:
+    """Get the gh auth token once per session ("" if gh isn't logged in)."""
+    result = run_gh_command(['auth', 'token'], timeout=10)
+    return result['stdout'].strip() if result['returncode'] == 0 else ""
+
+
+def _gh_api_session() -> Optional[Any]:
+    """Get the shared GitHub API session (None if it can't be used)."""
+    global _gh_session
+    if _gh_session is None:
+        if not REQUESTS_AVAILABLE:
+            return None
+        token = _get_gh_token()
+        if not token:
+            return None
+        session = requests.Session()
+        session.headers.update({
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+        })
+        _gh_session = session
+    return _gh_session
+
+
+def gh_api_get(path: str, params: Optional[Dict[str, Any]] = None, timeout: int = 30) -> Optional[Any]:
+    """
+    GET a GitHub REST API path using gh's credentials.
+
+    Requests share one keep-alive session, so repeated calls skip both the
+    gh process spawn and a fresh TLS handshake.
+
+    Returns the parsed JSON, or None if the API can't be used (requests
+    missing, no token, network or HTTP error) so callers can fall back to
+    the gh CLI.
+    """
+    session = _gh_api_session()
+    if session is None:
+        return None
+    try:
+        response = session.get(_GH_API_URL + path, params=params, timeout=timeout)
+        if response.status_code != 200:
+            return None
+        return _json_loads(response.content)
+    except Exception:
+        return None
+
+
+def _api_run_status(
+    owner: str,
+    repo: str,
+    run_id: int,
+    etag: Optional[str] = None,
+) -> Optional[Tuple[Optional[str], Optional[Dict[str, Any]]]]:
+    """
+    Fetch one workflow run via the REST API, as a conditional request.
+
+    Returns (etag, run) with run in `gh run view --json` shape, or with
+    run None when nothing changed since `etag` (a 304, which GitHub
+    doesn't count against the rate limit). Returns None if the API can't
+    be used.
+    """
+    session = _gh_api_session()
+    if session is None:
+        return None
+    headers = {"If-None-Match": etag} if etag else None
+    try:
+        response = session.get(
+            f"{_GH_API_URL}/repos/{owner}/{repo}/actions/runs/{run_id}",
+            headers=headers,
+            timeout=30,
         )
-        if result.returncode == 0:
-            url = result.stdout.strip()
-            # Parse GitHub URL
-            match = re.search(r'github\.com[:/]([^/]+)/([^/.]+)', url)
-            if match:
-                return {
-                    "owner": match.group(1),
-                    "repo": match.group(2),
-                }
+        if response.status_code == 304:
+            return etag, None
+        if response.status_code != 200:
+            return None
+        run = _json_loads(response.content)
     except Exception:
-        pass
-    return {"owner": "", "repo": ""}
+        return None
+    return response.headers.get("ETag"), {
+        "status": run.get('status') or "",
+        "conclusion": run.get('conclusion') or "",
+        "workflowName": run.get('name') or "",
+    }
+
 
+def _api_latest_runs(owner: str, repo: str) -> Optional[List[Dict[str, Any]]]:
+    """Latest workflow run via the REST API, in `gh run list --json` shape."""
+    data = gh_api_get(f"/repos/{owner}/{repo}/actions/runs", {"per_page": 1})
+    if data is None:
+        return None
+    return [
+        {
+            "databaseId": run.get('id'),
+            "status": run.get('status') or "",
+            "conclusion": run.get('conclusion') or "",
+            "name": run.get('name') or "",
+            "workflowName": run.get('name') or "",
+            "createdAt": run.get('created_at'),
+            "updatedAt": run.get('updated_at'),
+        }
+        for run in data.get('workflow_runs', [])
+    ]
 
 @register_tool
 class CheckCIStatusTool(BaseTool):
@@ -115,25 +515,33 @@ class CheckCIStatusTool(BaseTool):
 
     def execute(self, **params) -> ToolResult:
         """Check CI status."""
-        cwd = params.get("cwd")
+        cwd = params.get("cwd") or os.getcwd()
         workflow = params.get("workflow")
+        repo_info = get_repo_info(cwd)
 
-        # Build command
-        args = ['run', 'list', '--limit', '1', '--json',
-                'databaseId,status,conclusion,name,workflowName,createdAt,updatedAt']
+        # Ask the REST API directly when possible. Workflow filters go
+        # through gh, which resolves workflow names to IDs.
+        runs = None
+        if not workflow and repo_info['owner']:
+            runs = _api_latest_runs(repo_info['owner'], repo_info['repo'])
 
-        if workflow:
-            args.extend(['--workflow', workflow])
+        if runs is None:
+            # Build command
+            args = ['run', 'list', '--limit', '1', '--json',
+                    'databaseId,status,conclusion,name,workflowName,createdAt,updatedAt']
 
-        result = run_gh_command(args, cwd)
+            if workflow:
+                args.extend(['--workflow', workflow])
 
-        if result['returncode'] != 0:
-            return ToolResult.fail(f"Failed to check CI status: {result['stderr']}")
+            result = run_gh_command(args, cwd, text=False)
+
+            if result['returncode'] != 0:
+                return ToolResult.fail(f"Failed to check CI status: {result['stderr']}")
 
         # Parse JSON output
         try:
-            import json
-            runs = json.loads(result['stdout'])
+            if runs is None:
+                runs = _json_loads(result['stdout'])
 
             if not runs:
                 return ToolResult.ok(
@@ -145,20 +553,18 @@ class CheckCIStatusTool(BaseTool):
                 )
 
             run = runs[0]
-            repo_info = get_repo_info(cwd)
 
             # Calculate duration
             duration = ""
-            if run.get('createdAt') and run.get('updatedAt'):
+            created_at = run.get('createdAt')
+            updated_at = run.get('updatedAt')
+            if created_at and updated_at:
                 try:
-                    from datetime import datetime
-                    created = datetime.fromisoformat(run['createdAt'].replace('Z', '+00:00'))
-                    updated = datetime.fromisoformat(run['updatedAt'].replace('Z', '+00:00'))
-                    delta = updated - created
-                    minutes = int(delta.total_seconds() / 60)
-                    duration = f"{minutes}m"
-                except Exception:
+                    seconds = _parse_gh_ts(updated_at) - _parse_gh_ts(created_at)
+                except ValueError:
                     pass
+                else:
+                    duration = f"{int(seconds / 60)}m"
 
             # Build structured response
             ci_status = {
@@ -221,35 +627,54 @@ class GetCILogsTool(BaseTool):
             required=False,
             default=True,
         ),
+        ToolParam(
+            name="max_scan_chars",
+            type="int",
+            description="Scan only the first 64K characters and the last this many characters of the log (default: 524288)",
+            required=False,
+            default=524288,
+        ),
     ]
 
     def execute(self, **params) -> ToolResult:
         """Get CI logs."""
         run_id = params["run_id"]
-        cwd = params.get("cwd")
+        cwd = params.get("cwd") or os.getcwd()
         failed_only = params.get("failed_only", True)
+        max_scan_chars = params.get("max_scan_chars", 524288)
 
         # Get logs
         args = ['run', 'view', str(run_id), '--log']
         if failed_only:
             args.append('--log-failed')
 
-        result = run_gh_command(args, cwd, timeout=120)
+        # Failures are picked out line by line as the log streams in, and
+        # only the part of the log that is returned is kept in memory.
+        failed_tests: List[Dict[str, Any]] = []
+        seen: Set[Tuple[Any, ...]] = set()
+
+        def on_line(line: str) -> None:
+            if _FAIL_CANDIDATE_RE.search(line):
+                match = _FAIL_UNION.match(line)
+                if match:
+                    self._add_failed_test(match, failed_tests, seen)
+
+        window = _ScanWindow(on_line, max_scan_chars)
+        result = run_gh_command_streamed(
+            args, window.add, cwd, timeout=120, max_chars=50000,
+        )
 
         if result['returncode'] != 0:
             return ToolResult.fail(f"Failed to get CI logs: {result['stderr']}")
 
-        logs = result['stdout']
-
-        # Parse for failed tests
-        failed_tests = self._parse_failed_tests(logs)
+        window.flush()
 
         return ToolResult.ok(
             data={
                 "run_id": run_id,
-                "logs": logs[:50000],  # Truncate if very long
+                "logs": result['stdout'],  # Truncated if very long
                 "failed_tests": failed_tests,
-                "truncated": len(logs) > 50000,
+                "truncated": result['truncated'],
             },
             summary=f"{len(failed_tests)} failed tests found" if failed_tests else "Logs retrieved",
         )
@@ -257,37 +682,50 @@ class GetCILogsTool(BaseTool):
     def _parse_failed_tests(self, logs: str) -> List[Dict[str, Any]]:
         """Parse logs to extract failed test information."""
         failed_tests: List[Dict[str, Any]] = []
-
-        # Common test failure patterns
-        patterns = [
-            # pytest
-            r'(?P<test_name>\S+::test_\w+)\s+(?:FAILED|ERROR)',
-            r'FAILED\s+(?P<test_name>\S+::test_\w+)',
-            # Jest
-            r'FAIL\s+(?P<test_name>\S+\.test\.\w+)',
-            # Generic assertion errors
-            r'(?P<file>\w+\.py):(?P<line>\d+).*(?P<error>AssertionError|Error|Exception):\s*(?P<message>.+)',
-        ]
-
-        for line in logs.split('\n'):
-            for pattern in patterns:
-                match = re.search(pattern, line)
-                if match:
-                    groups = match.groupdict()
-                    test_info = {
-                        "test_name": groups.get('test_name', ''),
-                        "error_type": groups.get('error', 'TestFailure'),
-                        "message": groups.get('message', ''),
-                        "file": groups.get('file', ''),
-                        "line": int(groups['line']) if groups.get('line') else None,
-                    }
-                    # Avoid duplicates
-                    if test_info['test_name'] and test_info not in failed_tests:
-                        failed_tests.append(test_info)
-                    break
+        seen: Set[Tuple[Any, ...]] = set()
+
+        # Jump from one candidate line to the next and run the anchored
+        # union only there, instead of trying it at every line start
+        pos = 0
+        while True:
+            hit = _FAIL_CANDIDATE_RE.search(logs, pos)
+            if hit is None:
+                break
+            line_start = logs.rfind('\n', 0, hit.start()) + 1
+            match = _FAIL_UNION.match(logs, line_start)
+            if match:
+                self._add_failed_test(match, failed_tests, seen)
+            line_end = logs.find('\n', hit.end())
+            if line_end == -1:
+                break
+            pos = line_end + 1
 
         return failed_tests
 
+    @staticmethod
+    def _add_failed_test(
+        match: "re.Match[str]",
+        failed_tests: List[Dict[str, Any]],
+        seen: Set[Tuple[Any, ...]],
+    ) -> None:
+        """Record one _FAIL_UNION match, skipping duplicates."""
+        test_info = {
+            "test_name": (
+                match['pytest_name'] or match['pytest_failed'] or match['jest_name'] or ''
+            ),
+            "error_type": match['error'] or 'TestFailure',
+            "message": match['message'] or '',
+            "file": match['file'] or '',
+            "line": int(match['line']) if match['line'] else None,
+        }
+        if not test_info['test_name']:
+            return
+        # Avoid duplicates
+        key = tuple(test_info.values())
+        if key not in seen:
+            seen.add(key)
+            failed_tests.append(test_info)
+
 
 @register_tool
 class CheckCIResultTool(BaseTool):
@@ -320,19 +758,27 @@ class CheckCIResultTool(BaseTool):
     def execute(self, **params) -> ToolResult:
         """Check CI result."""
         run_id = params["run_id"]
-        cwd = params.get("cwd")
+        cwd = params.get("cwd") or os.getcwd()
 
-        # Get run info
-        args = ['run', 'view', str(run_id), '--json', 'status,conclusion']
+        # Get run info, over the REST API when possible
+        run_info = None
+        repo_info = get_repo_info(cwd)
+        if repo_info['owner']:
+            fetched = _api_run_status(repo_info['owner'], repo_info['repo'], run_id)
+            if fetched is not None:
+                run_info = fetched[1]
 
-        result = run_gh_command(args, cwd)
+        if run_info is None:
+            args = ['run', 'view', str(run_id), '--json', 'status,conclusion']
 
-        if result['returncode'] != 0:
-            return ToolResult.fail(f"Failed to check CI result: {result['stderr']}")
+            result = run_gh_command(args, cwd, text=False)
+
+            if result['returncode'] != 0:
+                return ToolResult.fail(f"Failed to check CI result: {result['stderr']}")
 
         try:
-            import json
-            run_info = json.loads(result['stdout'])
+            if run_info is None:
+                run_info = _json_loads(result['stdout'])
 
             status = run_info.get('status', 'unknown')
             conclusion = run_info.get('conclusion', 'unknown')
@@ -359,35 +805,56 @@ class CheckCIResultTool(BaseTool):
             return ToolResult.fail(f"Failed to parse CI result: {str(e)}")
 
 
-# Convenience functions for direct use
+# Convenience functions for direct use (these reuse the registered tool
+# instances rather than constructing a tool per call)
 
 def check_ci_status(cwd: Optional[str] = None) -> Dict[str, Any]:
     """Check latest CI status."""
-    tool = CheckCIStatusTool()
+    tool = tool_registry.get(CheckCIStatusTool.name)
     result = tool(cwd=cwd)
     return result.data if result.success else {"error": result.error}
 
 
 def get_ci_logs(run_id: int, cwd: Optional[str] = None) -> Dict[str, Any]:
     """Get CI logs for a run."""
-    tool = GetCILogsTool()
+    tool = tool_registry.get(GetCILogsTool.name)
     result = tool(run_id=run_id, cwd=cwd)
     return result.data if result.success else {"error": result.error}
 
 
 def check_ci_result(run_id: int, cwd: Optional[str] = None) -> Dict[str, Any]:
     """Check if CI run passed."""
-    tool = CheckCIResultTool()
+    tool = tool_registry.get(CheckCIResultTool.name)
     result = tool(run_id=run_id, cwd=cwd)
     return result.data if result.success else {"error": result.error}
 
 
+# Async variants. Each runs the tool on a worker thread, so several
+# lookups (e.g. status and logs) can be awaited together with
+# asyncio.gather and their gh calls overlap.
+
+async def acheck_ci_status(cwd: Optional[str] = None) -> Dict[str, Any]:
+    """Check latest CI status (async)."""
+    return await asyncio.to_thread(check_ci_status, cwd)
+
+
+async def aget_ci_logs(run_id: int, cwd: Optional[str] = None) -> Dict[str, Any]:
+    """Get CI logs for a run (async)."""
+    return await asyncio.to_thread(get_ci_logs, run_id, cwd)
+
+
+async def acheck_ci_result(run_id: int, cwd: Optional[str] = None) -> Dict[str, Any]:
+    """Check if CI run passed (async)."""
+    return await asyncio.to_thread(check_ci_result, run_id, cwd)
+
+
 @register_tool
 class WaitForCITool(BaseTool):
     """
     Wait for CI run to complete.
 
-    Polls the CI status until completion or timeout.
+    Polls the CI status until completion or timeout, backing off from 2s
+    up to poll_interval between checks.
     """
 
     name = "wait_for_ci"
@@ -412,7 +879,7 @@ class WaitForCITool(BaseTool):
         ToolParam(
             name="poll_interval",
             type="int",
-            description="Seconds between status checks (default: 30)",
+            description="Maximum seconds between status checks (default: 30)",
             required=False,
             default=30,
         ),
@@ -427,38 +894,57 @@ class WaitForCITool(BaseTool):
 
     def execute(self, **params) -> ToolResult:
         """Wait for CI to complete."""
-        import time
-        import json
-
         run_id = params.get("run_id")
         timeout = params.get("timeout", 600)
         poll_interval = params.get("poll_interval", 30)
-        cwd = params.get("cwd")
+        cwd = params.get("cwd") or os.getcwd()
+
+        repo_info = get_repo_info(cwd)
 
-        # If no run_id, get the latest
+        # If no run_id, get the latest (over the shared API session when
+        # possible, like the polls below)
         if not run_id:
-            args = ['run', 'list', '--limit', '1', '--json', 'databaseId']
-            result = run_gh_command(args, cwd)
-            if result['returncode'] == 0:
-                runs = json.loads(result['stdout'])
-                if runs:
-                    run_id = runs[0]['databaseId']
+            runs = None
+            if repo_info['owner']:
+                runs = _api_latest_runs(repo_info['owner'], repo_info['repo'])
+            if runs is None:
+                args = ['run', 'list', '--limit', '1', '--json', 'databaseId']
+                result = run_gh_command(args, cwd, text=False)
+                if result['returncode'] == 0:
+                    runs = _json_loads(result['stdout'])
+            if runs:
+                run_id = runs[0]['databaseId']
 
         if not run_id:
             return ToolResult.fail("No run ID provided and no recent runs found")
 
+        etag: Optional[str] = None
+        run_info: Dict[str, Any] = {}
+        delay = min(poll_interval, 2.0)
+
         start_time = time.time()
         elapsed = 0
 
         while elapsed < timeout:
-            # Check status
-            args = ['run', 'view', str(run_id), '--json', 'status,conclusion,workflowName']
-            result = run_gh_command(args, cwd)
+            # Check status, over the REST API when possible: unchanged runs
+            # come back as a cheap 304 and the previous status is reused
+            fetched = None
+            if repo_info['owner']:
+                fetched = _api_run_status(repo_info['owner'], repo_info['repo'], run_id, etag)
+
+            if fetched is not None:
+                etag, fresh = fetched
+                if fresh is not None:
+                    run_info = fresh
+            else:
+                args = ['run', 'view', str(run_id), '--json', 'status,conclusion,workflowName']
+                result = run_gh_command(args, cwd, text=False)
 
-            if result['returncode'] != 0:
-                return ToolResult.fail(f"Failed to check CI status: {result['stderr']}")
+                if result['returncode'] != 0:
+                    return ToolResult.fail(f"Failed to check CI status: {result['stderr']}")
+
+                run_info = _json_loads(result['stdout'])
 
-            run_info = json.loads(result['stdout'])
             status = run_info.get('status', '')
             conclusion = run_info.get('conclusion', '')
             workflow = run_info.get('workflowName', 'CI')
@@ -478,8 +964,10 @@ class WaitForCITool(BaseTool):
                             f"after {int(time.time() - start_time)}s",
                 )
 
-            # Still running, wait and poll again
-            time.sleep(poll_interval)
+            # Still running; poll again after a delay that backs off from
+            # 2s up to poll_interval
+            time.sleep(delay)
+            delay = min(poll_interval, delay * 1.5)
             elapsed = time.time() - start_time
 
         return ToolResult.fail(
@@ -488,6 +976,177 @@ class WaitForCITool(BaseTool):
         )
 
 
+# Characters that make an error pattern a regex rather than a plain keyword
+_REGEX_SYNTAX_RE = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+
+def _split_error_patterns(
+    patterns: List[str],
+) -> Tuple[Tuple[str, ...], List["re.Pattern[str]"]]:
+    """
+    Split case-insensitive error patterns into keywords and regexes.
+
+    Patterns without regex syntax are returned lowercased, to be found
+    with a substring test on the lowercased log; the others are compiled.
+    """
+    literals = tuple(p.lower() for p in patterns if not _REGEX_SYNTAX_RE.search(p))
+    regexes = [
+        re.compile(p, re.IGNORECASE) for p in patterns if _REGEX_SYNTAX_RE.search(p)
+    ]
+    return literals, regexes
+
+
+class _LogAnalysis:
+    """
+    Incremental CI log analysis for AnalyzeCIFailureTool.
+
+    Text is fed in blocks of whole lines. Every pattern is line-local, so
+    feeding a log block by block gives the same result as feeding it in
+    one piece, and a streamed log never has to be held in memory.
+    """
+
+    # Per-pattern limits on collected items
+    TEST_LIMIT = 10
+    DETAIL_LIMIT = 5
+    FILE_LIMIT = 5
+
+    def __init__(
+        self,
+        error_matchers: Dict[str, Tuple[Tuple[str, ...], List["re.Pattern[str]"]]],
+        prefilters: Dict[str, Tuple[str, ...]],
+        category: Optional[str] = None,
+    ):
+        self._error_matchers = list(error_matchers.items())
+        self._prefilters = prefilters
+        # A category known up front (e.g. from the failed step) skips
+        # category detection on the log text
+        self._category = category
+        # Index into _error_matchers of the highest-priority category seen
+        self._best = 0 if category else len(self._error_matchers)
+        self._tests: Dict[str, List[str]] = {"pytest": [], "jest": [], "checkmark": []}
+        self._details: List[List[str]] = [[] for _ in _ERROR_LINE_RES]
+        self._files: List[List[str]] = [[] for _ in _FILE_REF_RES]
+        self._error_line: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        """True once the category is settled and every list is at its limit."""
+        return (
+            self._best == 0
+            and all(len(names) >= self.TEST_LIMIT for names in self._tests.values())
+            and all(len(details) >= self.DETAIL_LIMIT for details in self._details)
+            and all(len(files) >= self.FILE_LIMIT for files in self._files)
+        )
+
+    def feed(self, text: str) -> None:
+        """Analyze a block of complete lines."""
+        # Nothing later in the log can change the result
+        if self.done:
+            return
+        # Only categories ranked above the best one found so far matter
+        if self._best:
+            lowered = text.lower()
+            for index, (cat, (literals, regexes)) in enumerate(self._error_matchers[:self._best]):
+                keywords = self._prefilters.get(cat)
+                if keywords and not any(k in lowered for k in keywords):
+                    continue
+                if (any(literal in lowered for literal in literals)
+                        or any(regex.search(text) for regex in regexes)):
+                    self._best = index
+                    break
+
+        # The remaining patterns each get their own pass on purpose: all but
+        # the first file reference pattern start with a literal, which the
+        # regex engine scans for far faster than it can try one combined
+        # alternation at each position. That file pattern starts with a
+        # \S+ run tied to a token start, so it only tries at token starts.
+        self._find_failed_tests(text)
+        checkmark = self._tests["checkmark"]
+        if len(checkmark) < self.TEST_LIMIT:
+            for match in _CHECKMARK_TEST_RE.finditer(text):
+                checkmark.append(match[1])
+                if len(checkmark) >= self.TEST_LIMIT:
+                    break
+
+        for regex, details in zip(_ERROR_LINE_RES, self._details):
+            if len(details) < self.DETAIL_LIMIT:
+                for match in regex.finditer(text):
+                    details.append(match[1])
+                    if len(details) >= self.DETAIL_LIMIT:
+                        break
+
+        for regex, files in zip(_FILE_REF_RES, self._files):
+            if len(files) < self.FILE_LIMIT:
+                for match in regex.finditer(text):
+                    files.append(f"{match[1]}:{match[2]}")
+                    if len(files) >= self.FILE_LIMIT:
+                        break
+
+        # First line mentioning an error, used when nothing else matched
+        if self._error_line is None:
+            match = _ERROR_KEYWORD_RE.search(text)
+            if match:
+                start = text.rfind('\n', 0, match.start()) + 1
+                end = text.find('\n', match.end())
+                if end == -1:
+                    end = len(text)
+                self._error_line = text[start:end].strip()[:200]
+
+    def _find_failed_tests(self, text: str) -> None:
+        """
+        Collect pytest and Jest failures, up to TEST_LIMIT of each.
+
+        Equivalent to running each pattern's findall() separately: a match
+        of one kind is skipped if it starts inside the previous match of
+        the same kind.
+        """
+        pytest, jest = self._tests["pytest"], self._tests["jest"]
+        if len(pytest) >= self.TEST_LIMIT and len(jest) >= self.TEST_LIMIT:
+            return
+        ends = {"pytest": 0, "jest": 0}
+        for match in _FAIL_TEST_RE.finditer(text):
+            kind = "pytest" if match['pytest'] is not None else "jest"
+            names = self._tests[kind]
+            if len(names) < self.TEST_LIMIT and match.start() >= ends[kind]:
+                names.append(match[kind])
+                ends[kind] = match.end(kind)
+                if len(pytest) >= self.TEST_LIMIT and len(jest) >= self.TEST_LIMIT:
+                    break
+
+    def result(self) -> Dict[str, Any]:
+        """Build the analysis from everything fed so far."""
+        if self._category:
+            category = self._category
+        elif self._best < len(self._error_matchers):
+            category = self._error_matchers[self._best][0]
+        else:
+            category = "unknown"
+
+        failed_tests = self._tests["pytest"] + self._tests["jest"] + self._tests["checkmark"]
+        details = [d for group in self._details for d in group]
+        affected_files = [f for group in self._files for f in group]
+
+        # Generate summary
+        if failed_tests:
+            summary = f"{len(failed_tests)} test(s) failed: {', '.join(failed_tests[:3])}"
+        elif details:
+            summary = details[0][:200]
+        elif self._error_line is not None:
+            summary = self._error_line
+        else:
+            summary = "Unknown failure"
+
+        # Deduplicate, keeping first-seen order (dicts preserve insertion
+        # order; a set round-trip returned them in arbitrary order)
+        return {
+            "category": category,
+            "summary": summary,
+            "failed_tests": list(dict.fromkeys(failed_tests)),
+            "details": list(dict.fromkeys(details)),
+            "affected_files": list(dict.fromkeys(affected_files)),
+        }
+
+
 @register_tool
 class AnalyzeCIFailureTool(BaseTool):
     """
@@ -514,13 +1173,20 @@ class AnalyzeCIFailureTool(BaseTool):
             required=False,
             default=None,
         ),
+        ToolParam(
+            name="max_scan_chars",
+            type="int",
+            description="Scan only the first 64K characters and the last this many characters of the log (default: 524288)",
+            required=False,
+            default=524288,
+        ),
     ]
 
     # Common error patterns and their categories
     ERROR_PATTERNS = {
         "test_failure": [
-            r'FAILED\s+(\S+)',
-            r'FAIL\s+(\S+)',
+            r'FAILED[^\S\n]+(\S+)',
+            r'FAIL[^\S\n]+(\S+)',
             r'AssertionError',
             r'Expected .* but got',
             r'test.*failed',
@@ -567,22 +1233,80 @@ class AnalyzeCIFailureTool(BaseTool):
         ],
     }
 
+    # Failed step name keyword -> category, checked in order before
+    # falling back to the log text
+    STEP_CATEGORIES = (
+        ("install", "dependency_error"),
+        ("dependenc", "dependency_error"),
+        ("build", "build_error"),
+        ("compile", "build_error"),
+        ("mypy", "type_error"),
+        ("type check", "type_error"),
+        ("test", "test_failure"),
+    )
+
+    # ERROR_PATTERNS prepared once, when the class is created: plain
+    # keywords become lowercase substrings, the rest compiled regexes
+    _ERROR_MATCHERS = {
+        cat: _split_error_patterns(patterns)
+        for cat, patterns in ERROR_PATTERNS.items()
+    }
+
+    # Lowercase substrings at least one of which appears in any text
+    # matched by the category's patterns; categories whose keywords are
+    # all absent are skipped without running their regexes.
+    ERROR_PREFILTERS = {
+        "test_failure": ("fail", "assertionerror", "expected"),
+        "syntax_error": ("syntaxerror", "indentationerror", "unexpected token", "parse error"),
+        "import_error": ("importerror", "modulenotfounderror", "cannot find module", "no module named"),
+        "type_error": ("typeerror", "is not a function", "is not callable", "undefined is not"),
+        "build_error": ("build failed", "compilation failed", "error: ", "fatal error"),
+        "dependency_error": ("npm err!", "pip install", "could not resolve dependencies", "package "),
+        "timeout": ("time", "deadline exceeded"),
+        "permission_error": ("permission denied", "eacces", "not authorized"),
+    }
+
     def execute(self, **params) -> ToolResult:
         """Analyze CI failure."""
         run_id = params["run_id"]
-        cwd = params.get("cwd")
+        cwd = params.get("cwd") or os.getcwd()
+        max_scan_chars = params.get("max_scan_chars", 524288)
 
-        # Get failed logs
+        # Which steps failed (and likely why) comes from the run's job data
+        failed_steps, step_category = self._failed_steps(run_id, cwd)
+
+        # Get failed logs, analyzing them in blocks of lines as they stream
+        # in; only the excerpt is kept
+        log_analysis = _LogAnalysis(
+            self._ERROR_MATCHERS, self.ERROR_PREFILTERS, category=step_category,
+        )
+        block: List[str] = []
+        block_size = 0
+        done = False
+
+        def on_line(line: str) -> None:
+            nonlocal block_size, done
+            if done:
+                return
+            block.append(line)
+            block_size += len(line)
+            if block_size >= 65536:
+                log_analysis.feed(''.join(block))
+                block.clear()
+                block_size = 0
+                # Stop buffering once the rest of the log can't matter
+                done = log_analysis.done
+
+        window = _ScanWindow(on_line, max_scan_chars)
         args = ['run', 'view', str(run_id), '--log-failed']
-        result = run_gh_command(args, cwd, timeout=120)
+        result = run_gh_command_streamed(args, window.add, cwd, timeout=120, max_chars=5000)
 
         if result['returncode'] != 0:
             return ToolResult.fail(f"Failed to get CI logs: {result['stderr']}")
 
-        logs = result['stdout']
-
-        # Analyze the logs
-        analysis = self._analyze_logs(logs)
+        window.flush()
+        log_analysis.feed(''.join(block))
+        analysis = log_analysis.result()
 
         return ToolResult.ok(
             data={
@@ -592,78 +1316,56 @@ class AnalyzeCIFailureTool(BaseTool):
                 "failed_tests": analysis["failed_tests"],
                 "error_details": analysis["details"],
                 "affected_files": analysis["affected_files"],
-                "log_excerpt": logs[:5000] if len(logs) > 5000 else logs,
+                "failed_steps": failed_steps,
+                "log_excerpt": result['stdout'],
             },
             summary=f"CI failed: {analysis['category']} - {analysis['summary'][:100]}",
         )
 
+    def _failed_steps(self, run_id: int, cwd: str) -> Tuple[List[str], Optional[str]]:
+        """
+        Find the failed jobs/steps of a run from its structured job data.
+
+        Returns ("job / step" names, category guessed from them or None).
+        Empty if the job data can't be fetched.
+        """
+        repo_info = get_repo_info(cwd)
+        data = None
+        if repo_info['owner']:
+            data = gh_api_get(f"/repos/{repo_info['owner']}/{repo_info['repo']}/actions/runs/{run_id}/jobs")
+        if data is None:
+            result = run_gh_command(['run', 'view', str(run_id), '--json', 'jobs'], cwd, text=False)
+            if result['returncode'] != 0:
+                return [], None
+            try:
+                data = _json_loads(result['stdout'])
+            except ValueError:
+                return [], None
+        if not isinstance(data, dict):
+            return [], None
+
+        failed: List[str] = []
+        category = None
+        for job in data.get('jobs') or []:
+            if job.get('conclusion') == 'timed_out':
+                category = category or "timeout"
+            for step in job.get('steps') or []:
+                if step.get('conclusion') != 'failure':
+                    continue
+                failed.append(f"{job.get('name', '')} / {step.get('name', '')}")
+                if category is None:
+                    step_name = (step.get('name') or '').lower()
+                    for keyword, step_category in self.STEP_CATEGORIES:
+                        if keyword in step_name:
+                            category = step_category
+                            break
+        return failed, category
+
     def _analyze_logs(self, logs: str) -> Dict[str, Any]:
         """Analyze logs to categorize and extract error information."""
-        category = "unknown"
-        summary = "Unknown failure"
-        failed_tests: List[str] = []
-        details: List[str] = []
-        affected_files: List[str] = []
-
-        # Find error category
-        for cat, patterns in self.ERROR_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, logs, re.IGNORECASE):
-                    category = cat
-                    break
-            if category != "unknown":
-                break
-
-        # Extract failed test names
-        test_patterns = [
-            r'FAILED\s+(\S+::\S+)',
-            r'FAIL\s+(\S+\.test\.\w+)',
-            r'✕\s+(\S+)',
-        ]
-        for pattern in test_patterns:
-            matches = re.findall(pattern, logs)
-            failed_tests.extend(matches[:10])  # Limit to 10
-
-        # Extract error messages
-        error_line_patterns = [
-            r'Error:\s*(.+)',
-            r'error\[\w+\]:\s*(.+)',
-            r'AssertionError:\s*(.+)',
-            r'TypeError:\s*(.+)',
-        ]
-        for pattern in error_line_patterns:
-            matches = re.findall(pattern, logs)
-            details.extend(matches[:5])  # Limit to 5
-
-        # Extract affected files
-        file_patterns = [
-            r'(\S+\.(?:py|js|ts|jsx|tsx)):(\d+)',
-            r'at (\S+\.(?:py|js|ts)):(\d+)',
-        ]
-        for pattern in file_patterns:
-            matches = re.findall(pattern, logs)
-            for match in matches[:5]:
-                affected_files.append(f"{match[0]}:{match[1]}")
-
-        # Generate summary
-        if failed_tests:
-            summary = f"{len(failed_tests)} test(s) failed: {', '.join(failed_tests[:3])}"
-        elif details:
-            summary = details[0][:200]
-        else:
-            # Try to extract the most relevant error line
-            for line in logs.split('\n'):
-                if any(keyword in line.lower() for keyword in ['error', 'fail', 'exception']):
-                    summary = line.strip()[:200]
-                    break
-
-        return {
-            "category": category,
-            "summary": summary,
-            "failed_tests": list(set(failed_tests)),
-            "details": list(set(details)),
-            "affected_files": list(set(affected_files)),
-        }
+        analysis = _LogAnalysis(self._ERROR_MATCHERS, self.ERROR_PREFILTERS)
+        analysis.feed(logs)
+        return analysis.result()
 
 
 @register_tool
@@ -755,10 +1457,10 @@ class SuggestCIFixTool(BaseTool):
     def execute(self, **params) -> ToolResult:
         """Suggest fixes for CI failure."""
         run_id = params["run_id"]
-        cwd = params.get("cwd")
+        cwd = params.get("cwd") or os.getcwd()
 
         # First analyze the failure
-        analyze_tool = AnalyzeCIFailureTool()
+        analyze_tool = tool_registry.get(AnalyzeCIFailureTool.name)
         analysis_result = analyze_tool(run_id=run_id, cwd=cwd)
 
         if not analysis_result.success:
@@ -850,20 +1552,17 @@ class TriggerWorkflowTool(BaseTool):
 
     def execute(self, **params) -> ToolResult:
         """Trigger workflow."""
-        import json
-        import subprocess
-
         workflow = params["workflow"]
         ref = params.get("ref")
         inputs = params.get("inputs", {})
-        cwd = params.get("cwd")
+        cwd = params.get("cwd") or os.getcwd()
 
         # Get current branch if ref not specified
         if not ref:
             try:
                 result = subprocess.run(
                     ['git', 'branch', '--show-current'],
-                    cwd=cwd or os.getcwd(),
+                    cwd=cwd,
                     capture_output=True,
                     text=True,
                     timeout=5,
@@ -922,42 +1621,47 @@ class PRStatusTool(BaseTool):
         ),
     ]
 
+    # The only fields execute() reads; asking gh for just these keeps the
+    # payload small
+    JSON_FIELDS = 'number,title,state,mergeable,reviewDecision,statusCheckRollup,additions,deletions,changedFiles'
+
+    # Check conclusion -> check_summary bucket; anything else is pending
+    CHECK_BUCKETS = {
+        'success': 'passed',
+        'failure': 'failed',
+        'cancelled': 'failed',
+    }
+
     def execute(self, **params) -> ToolResult:
         """Get PR status."""
-        import json
-
         pr_number = params.get("pr_number")
-        cwd = params.get("cwd")
+        cwd = params.get("cwd") or os.getcwd()
 
         # Build command
         if pr_number:
-            args = ['pr', 'view', str(pr_number), '--json',
-                    'number,title,state,mergeable,reviewDecision,statusCheckRollup,additions,deletions,changedFiles']
+            args = ['pr', 'view', str(pr_number), '--json', self.JSON_FIELDS]
         else:
             # Get PR for current branch
-            args = ['pr', 'view', '--json',
-                    'number,title,state,mergeable,reviewDecision,statusCheckRollup,additions,deletions,changedFiles']
+            args = ['pr', 'view', '--json', self.JSON_FIELDS]
 
-        result = run_gh_command(args, cwd)
+        result = run_gh_command(args, cwd, text=False)
 
         if result['returncode'] != 0:
             if 'no pull requests found' in result['stderr'].lower():
                 return ToolResult.fail("No pull request found for current branch")
             return ToolResult.fail(f"Failed to get PR status: {result['stderr']}")
 
-        pr_info = json.loads(result['stdout'])
+        # Only a handful of fields are read from the (possibly large) payload
+        pr_info = _json_loads_lazy(result['stdout'])
 
         # Parse check status
         checks = pr_info.get('statusCheckRollup', []) or []
         check_summary = {"passed": 0, "failed": 0, "pending": 0}
+        buckets = self.CHECK_BUCKETS
         for check in checks:
-            conclusion = check.get('conclusion', '').lower()
-            if conclusion == 'success':
-                check_summary["passed"] += 1
-            elif conclusion in ('failure', 'cancelled'):
-                check_summary["failed"] += 1
-            else:
-                check_summary["pending"] += 1
+            # Checks still running have no conclusion yet
+            conclusion = (check.get('conclusion') or '').lower()
+            check_summary[buckets.get(conclusion, "pending")] += 1
 
         # Determine overall status
         review_decision = pr_info.get('reviewDecision', 'REVIEW_REQUIRED')
@@ -999,34 +1703,34 @@ class PRStatusTool(BaseTool):
 
 def wait_for_ci(run_id: Optional[int] = None, timeout: int = 600, cwd: Optional[str] = None) -> Dict[str, Any]:
     """Wait for CI to complete."""
-    tool = WaitForCITool()
+    tool = tool_registry.get(WaitForCITool.name)
     result = tool(run_id=run_id, timeout=timeout, cwd=cwd)
     return result.data if result.success else {"error": result.error}
 
 
 def analyze_ci_failure(run_id: int, cwd: Optional[str] = None) -> Dict[str, Any]:
     """Analyze CI failure."""
-    tool = AnalyzeCIFailureTool()
+    tool = tool_registry.get(AnalyzeCIFailureTool.name)
     result = tool(run_id=run_id, cwd=cwd)
     return result.data if result.success else {"error": result.error}
 
 
 def suggest_ci_fix(run_id: int, cwd: Optional[str] = None) -> Dict[str, Any]:
     """Suggest fixes for CI failure."""
-    tool = SuggestCIFixTool()
+    tool = tool_registry.get(SuggestCIFixTool.name)
     result = tool(run_id=run_id, cwd=cwd)
     return result.data if result.success else {"error": result.error}
 
 
 def trigger_workflow(workflow: str, ref: Optional[str] = None, cwd: Optional[str] = None) -> Dict[str, Any]:
     """Trigger a workflow."""
-    tool = TriggerWorkflowTool()
+    tool = tool_registry.get(TriggerWorkflowTool.name)
     result = tool(workflow=workflow, ref=ref, cwd=cwd)
     return result.data if result.success else {"error": result.error}
 
 
 def pr_status(pr_number: Optional[int] = None, cwd: Optional[str] = None) -> Dict[str, Any]:
     """Get PR status."""
-    tool = PRStatusTool()
+    tool = tool_registry.get(PRStatusTool.name)
     result = tool(pr_number=pr_number, cwd=cwd)
     return result.data if result.success else {"error": result.error}
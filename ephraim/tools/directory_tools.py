@@ -11,9 +11,11 @@ Safety features:
 
 import os
 import shutil
+import stat
 from typing import Optional
 
-from .base import BaseTool, ToolResult, ToolParam, ToolCategory, register_tool
+from .base import BaseTool, ToolResult, ToolParam, ToolCategory, register_tool, tool_registry
+from .file_operations import _stat_or_none
 from .write_file import is_dangerous_path
 
 
@@ -26,11 +28,44 @@ ABSOLUTELY_PROTECTED = [
     '.env',  # Environment directories
 ]
 
+# Lowercased once for O(1) lookups
+_ABSOLUTELY_PROTECTED_SET = frozenset(p.lower() for p in ABSOLUTELY_PROTECTED)
+
 
 def is_absolutely_protected(path: str) -> bool:
     """Check if directory is absolutely protected from deletion."""
     basename = os.path.basename(path).lower()
-    return basename in [p.lower() for p in ABSOLUTELY_PROTECTED]
+    return basename in _ABSOLUTELY_PROTECTED_SET
+
+
+def _count_files_capped(path: str, cap: int) -> int:
+    """
+    Count the files under path (as os.walk would list them), stopping early.
+
+    Returns as soon as the count exceeds cap, so a huge tree is never walked
+    in full just to find out that it is too big. Unreadable directories are
+    skipped, as with os.walk.
+    """
+    count = 0
+    stack = [path]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    count += 1
+                    if count > cap:
+                        return count
+                elif not entry.is_symlink():
+                    stack.append(entry.path)
+    return count
 
 
 @register_tool
@@ -149,12 +184,12 @@ class DeleteDirectoryTool(BaseTool):
                 f"Use run_command with caution if you really need to delete this."
             )
 
-        # Check exists
-        if not os.path.exists(path):
+        # Check exists and is a directory, with a single stat
+        path_stat = _stat_or_none(path)
+        if path_stat is None:
             return ToolResult.fail(f"Directory not found: {path}")
 
-        # Check it's a directory
-        if not os.path.isdir(path):
+        if not stat.S_ISDIR(path_stat.st_mode):
             return ToolResult.fail(f"Path is not a directory: {path}")
 
         # Count contents for reporting
@@ -173,12 +208,9 @@ class DeleteDirectoryTool(BaseTool):
 
         # Additional safety for large directories
         if recursive and file_count > 100:
-            total_files = sum(
-                len(files) for _, _, files in os.walk(path)
-            )
-            if total_files > 1000:
+            if _count_files_capped(path, 1000) > 1000:
                 return ToolResult.fail(
-                    f"Directory contains {total_files} files. "
+                    f"Directory contains more than 1000 files. "
                     f"Use run_command for large directory deletions."
                 )
 
@@ -204,11 +236,11 @@ class DeleteDirectoryTool(BaseTool):
 # Convenience functions
 def create_directory(path: str, parents: bool = True) -> ToolResult:
     """Create a directory."""
-    tool = CreateDirectoryTool()
+    tool = tool_registry.get(CreateDirectoryTool.name)
     return tool(path=path, parents=parents)
 
 
 def delete_directory(path: str, recursive: bool = False) -> ToolResult:
     """Delete a directory."""
-    tool = DeleteDirectoryTool()
+    tool = tool_registry.get(DeleteDirectoryTool.name)
     return tool(path=path, recursive=recursive)
@@ -9,14 +9,33 @@ Safety features:
 - Creates backups before destructive operations
 """
 
+import errno
 import os
 import shutil
+import stat
 from datetime import datetime
 from typing import Optional
 
-from .base import BaseTool, ToolResult, ToolParam, ToolCategory, register_tool
+from .base import BaseTool, ToolResult, ToolParam, ToolCategory, register_tool, tool_registry
 from .write_file import is_dangerous_path
 
+# Optional: reflink copies on copy-on-write filesystems (not on Windows)
+FCNTL_AVAILABLE = False
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    pass
+
+# Linux ioctl that makes dst share src's data blocks (btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
+# Errors meaning "this copy method isn't supported here", not a failed copy
+_COPY_UNSUPPORTED = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTTY,
+    errno.EOPNOTSUPP, errno.ENOTSUP, errno.EPERM, errno.EBADF,
+}
+
 
 # Additional patterns that should not be deleted
 PROTECTED_PATTERNS = [
@@ -25,11 +44,66 @@ PROTECTED_PATTERNS = [
     'node_modules',  # Large dependency folders (delete via rm command if needed)
 ]
 
+# Lowercased once for O(1) lookups
+_PROTECTED_SET = frozenset(p.lower() for p in PROTECTED_PATTERNS)
+
 
 def is_protected_file(path: str) -> bool:
     """Check if a file/directory is protected from deletion."""
     basename = os.path.basename(path).lower()
-    return basename in [p.lower() for p in PROTECTED_PATTERNS]
+    return basename in _PROTECTED_SET
+
+
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """os.stat(path), or None where os.path.exists(path) would be False."""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """
+    Copy a file with its metadata, like shutil.copy2, but in the kernel.
+
+    Tries a reflink first (no data is copied at all on copy-on-write
+    filesystems), then os.copy_file_range, and falls back to
+    shutil.copyfile where neither is supported or the copy comes out
+    short.
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+    copied = False
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        src_size = os.fstat(src_fd).st_size
+        if FCNTL_AVAILABLE:
+            try:
+                fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+                copied = True
+            except OSError as e:
+                if e.errno not in _COPY_UNSUPPORTED:
+                    raise
+        if not copied and hasattr(os, 'copy_file_range'):
+            try:
+                # Some filesystems (procfs, sysfs, some FUSE and overlay
+                # mounts) report success while copying nothing; like
+                # shutil, treat a first call copying 0 bytes of a non-empty
+                # file as unsupported
+                sent = os.copy_file_range(src_fd, dst_fd, 1 << 30)
+                copied = sent > 0 or src_size == 0
+                while sent:
+                    sent = os.copy_file_range(src_fd, dst_fd, 1 << 30)
+            except OSError as e:
+                if e.errno not in _COPY_UNSUPPORTED:
+                    raise
+        # Only trust a kernel copy that produced the whole file
+        if copied and os.fstat(dst_fd).st_size != src_size:
+            copied = False
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
 
 
 @register_tool
@@ -82,11 +156,12 @@ class DeleteFileTool(BaseTool):
             )
 
         # Check file exists
-        if not os.path.exists(path):
+        path_stat = _stat_or_none(path)
+        if path_stat is None:
             return ToolResult.fail(f"File not found: {path}")
 
         # Check it's a file (not directory)
-        if os.path.isdir(path):
+        if stat.S_ISDIR(path_stat.st_mode):
             return ToolResult.fail(
                 f"Path is a directory, not a file: {path}. "
                 f"Use delete_directory for directories."
@@ -122,7 +197,7 @@ class DeleteFileTool(BaseTool):
             backup_filename = f"{filename}.{timestamp}.deleted.bak"
             backup_path = os.path.join(backup_dir, backup_filename)
 
-            shutil.copy2(path, backup_path)
+            _fast_copy(path, backup_path)
             return backup_path
         except Exception:
             return None
@@ -174,16 +249,18 @@ class MoveFileTool(BaseTool):
         if is_dangerous_path(destination):
             return ToolResult.fail(f"Cannot move to protected path: {destination}")
 
-        # Check source exists
-        if not os.path.exists(source):
+        # Check source exists (one stat answers both questions)
+        source_stat = _stat_or_none(source)
+        if source_stat is None:
             return ToolResult.fail(f"Source file not found: {source}")
 
-        if os.path.isdir(source):
+        if stat.S_ISDIR(source_stat.st_mode):
             return ToolResult.fail(f"Source is a directory: {source}. Use for files only.")
 
         # Check destination
-        if os.path.exists(destination):
-            if os.path.isdir(destination):
+        dest_stat = _stat_or_none(destination)
+        if dest_stat is not None:
+            if stat.S_ISDIR(dest_stat.st_mode):
                 # Move into directory
                 destination = os.path.join(destination, os.path.basename(source))
             elif not overwrite:
@@ -258,16 +335,18 @@ class CopyFileTool(BaseTool):
         if is_dangerous_path(destination):
             return ToolResult.fail(f"Cannot copy to protected path: {destination}")
 
-        # Check source exists
-        if not os.path.exists(source):
+        # Check source exists (one stat answers both questions)
+        source_stat = _stat_or_none(source)
+        if source_stat is None:
             return ToolResult.fail(f"Source file not found: {source}")
 
-        if os.path.isdir(source):
+        if stat.S_ISDIR(source_stat.st_mode):
             return ToolResult.fail(f"Source is a directory: {source}. Use for files only.")
 
         # Check destination
-        if os.path.exists(destination):
-            if os.path.isdir(destination):
+        dest_stat = _stat_or_none(destination)
+        if dest_stat is not None:
+            if stat.S_ISDIR(dest_stat.st_mode):
                 # Copy into directory
                 destination = os.path.join(destination, os.path.basename(source))
             elif not overwrite:
@@ -285,12 +364,12 @@ class CopyFileTool(BaseTool):
 
         # Copy the file (preserving metadata)
         try:
-            shutil.copy2(source, destination)
+            _fast_copy(source, destination)
         except Exception as e:
             return ToolResult.fail(f"Failed to copy file: {str(e)}")
 
-        # Get file size
-        size = os.path.getsize(destination)
+        # The copy has the source's size
+        size = source_stat.st_size
 
         return ToolResult.ok(
             data={
@@ -305,17 +384,17 @@ class CopyFileTool(BaseTool):
 # Convenience functions
 def delete_file(path: str, backup: bool = True) -> ToolResult:
     """Delete a file."""
-    tool = DeleteFileTool()
+    tool = tool_registry.get(DeleteFileTool.name)
     return tool(path=path, backup=backup)
 
 
 def move_file(source: str, destination: str, overwrite: bool = False) -> ToolResult:
     """Move a file."""
-    tool = MoveFileTool()
+    tool = tool_registry.get(MoveFileTool.name)
     return tool(source=source, destination=destination, overwrite=overwrite)
 
 
 def copy_file(source: str, destination: str, overwrite: bool = False) -> ToolResult:
     """Copy a file."""
-    tool = CopyFileTool()
+    tool = tool_registry.get(CopyFileTool.name)
     return tool(source=source, destination=destination, overwrite=overwrite)
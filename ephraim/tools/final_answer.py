@@ -6,8 +6,7 @@ Marks task completion and provides summary.
 
 from datetime import datetime
 
-from .base import BaseTool, ToolResult, ToolParam, ToolCategory, register_tool
-from ..logging_setup import print_success, print_separator, console
+from .base import BaseTool, ToolResult, ToolParam, ToolCategory, register_tool, tool_registry
 
 
 @register_tool
@@ -55,6 +54,9 @@ class FinalAnswerTool(BaseTool):
 
     def execute(self, **params) -> ToolResult:
         """Mark task complete and display summary."""
+        # Imported here so importing the tools package doesn't load rich
+        from ..logging_setup import print_success, print_separator, console
+
         message = params["message"]
         files_modified = params.get("files_modified") or []
         tests_passed = params.get("tests_passed")
@@ -106,7 +108,7 @@ def mark_task_complete(
 
     Can be called directly without going through tool registry.
     """
-    tool = FinalAnswerTool()
+    tool = tool_registry.get(FinalAnswerTool.name)
     return tool(
         message=message,
         files_modified=files_modified or [],
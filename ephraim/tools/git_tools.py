@@ -12,34 +12,84 @@ Commands:
 
 import os
 import re
+import shutil
 import subprocess
 from typing import Dict, Any, List, Optional
 
 from .base import BaseTool, ToolResult, ToolParam, ToolCategory, register_tool
 
 
+# git resolved on PATH once, rather than by every subprocess call
+_GIT_EXE = shutil.which('git') or 'git'
+
+# `diff --git a/<path> b/<path>` -> new path (the " b/" keeps a "b/" inside
+# the old path, as in a/lib/..., from being taken for the new one)
+_DIFF_FILE_RE = re.compile(r' b/(.+)$')
+# The same for a C-quoted new path, as git writes names with non-ASCII or
+# special characters: `diff --git "a/<path>" "b/<path>"`. A '"' inside a
+# quoted path is escaped, and names containing one are always quoted.
+_QUOTED_DIFF_FILE_RE = re.compile(r' "b/((?:[^"\\]|\\.)*)"$')
+# One escape in a C-quoted path: three octal digits (one byte) or a character
+_QUOTED_ESCAPE_RE = re.compile(rb'\\([0-7]{3}|.)')
+_QUOTED_ESCAPES = {
+    b'a': b'\a', b'b': b'\b', b't': b'\t', b'n': b'\n',
+    b'v': b'\v', b'f': b'\f', b'r': b'\r',
+}
+# `@@ -old[,count] +new[,count] @@` -> old start, new start
+_HUNK_HEADER_RE = re.compile(r'@@ -(\d+),?\d* \+(\d+),?\d* @@')
+# "2 files changed, 4 insertions(+), 1 deletion(-)" from commit/pull output
+_CHANGE_STATS_RE = re.compile(
+    r'(?P<files>\d+) files? changed'
+    r'(?:, (?P<insertions>\d+) insertions?\(\+\))?'
+    r'(?:, (?P<deletions>\d+) deletions?\(-\))?'
+)
+# git commit's "[branch (root-commit) abc1234] subject" line -> new commit's hash
+_COMMIT_HEADER_RE = re.compile(r'\[.*? ([0-9a-f]{7,})\] ')
+
+# Porcelain status letters -> which list GitStatusTool puts the file in,
+# for the index (X) and work tree (Y) columns
+_INDEX_STATUS_KINDS = {
+    'M': "staged", 'A': "staged", 'R': "staged", 'C': "staged", 'D': "deleted",
+}
+_WORKTREE_STATUS_KINDS = {'M': "modified", 'D': "deleted"}
+
+
 def run_git_command(
     args: List[str],
     cwd: Optional[str] = None,
     timeout: int = 30,
+    env: Optional[Dict[str, str]] = None,
+    input: Optional[bytes] = None,
+    errors: str = 'replace',
 ) -> Dict[str, Any]:
     """
     Run a git command and return result.
 
+    env holds variables to set on top of the current environment;
+    input, if given, is written to the command's stdin.
+
+    Output is captured as bytes and decoded once as UTF-8 (git's own
+    encoding), replacing invalid bytes, so a diff of a non-UTF-8 file
+    can't fail the command and no newline translation pass is made over
+    the output ('\r' in diff content is kept as it is). Pass
+    errors='surrogateescape' where stdout holds raw paths that must be
+    handed back to git, so non-UTF-8 names round-trip like os.fsdecode.
+
     Returns dict with: returncode, stdout, stderr
     """
     try:
         result = subprocess.run(
-            ['git'] + args,
+            [_GIT_EXE] + args,
             cwd=cwd or os.getcwd(),
+            input=input,
             capture_output=True,
-            text=True,
             timeout=timeout,
+            env=dict(os.environ, **env) if env else None,
         )
         return {
             "returncode": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
+            "stdout": result.stdout.decode('utf-8', errors=errors),
+            "stderr": result.stderr.decode('utf-8', errors='replace'),
         }
     except subprocess.TimeoutExpired:
         return {
@@ -55,6 +105,41 @@ def run_git_command(
         }
 
 
+def _unquote_path(quoted: str) -> str:
+    """
+    Undo git's C-style quoting of a path (the text between the quotes).
+
+    Octal escapes are bytes of the UTF-8 name; bytes that aren't valid
+    UTF-8 are kept with surrogateescape, as in git status paths.
+    """
+    raw = _QUOTED_ESCAPE_RE.sub(
+        lambda m: (
+            bytes([int(m.group(1), 8)]) if len(m.group(1)) == 3
+            else _QUOTED_ESCAPES.get(m.group(1), m.group(1))
+        ),
+        quoted.encode('utf-8', 'surrogateescape'),
+    )
+    return raw.decode('utf-8', 'surrogateescape')
+
+
+def _parse_branch_header(header: str) -> str:
+    """
+    Get the current branch from a `git status --branch` header.
+
+    The header is "main...origin/main [ahead 1]", "main" without an
+    upstream, "No commits yet on main" in a new repository, or
+    "HEAD (no branch)" when detached (no current branch, as with
+    `git branch --show-current`).
+    """
+    for prefix in ('No commits yet on ', 'Initial commit on '):
+        if header.startswith(prefix):
+            return header[len(prefix):]
+    if header.startswith('HEAD (no branch)'):
+        return ""
+    # Ref names can't contain "..", so "..." only separates the upstream
+    return header.split('...', 1)[0].split(' ', 1)[0]
+
+
 @register_tool
 class GitStatusTool(BaseTool):
     """
@@ -81,51 +166,65 @@ class GitStatusTool(BaseTool):
         """Get git status."""
         cwd = params.get("cwd")
 
-        # Get branch
-        branch_result = run_git_command(['branch', '--show-current'], cwd)
-        branch = branch_result['stdout'].strip() if branch_result['returncode'] == 0 else ""
-
-        # Get status
-        status_result = run_git_command(['status', '--porcelain'], cwd)
+        # Get status, with the branch in a "## " header line. The C locale
+        # keeps that header's wording (e.g. "No commits yet on") stable.
+        # -z separates entries with NUL and leaves file names unquoted, as
+        # raw bytes: surrogateescape keeps non-UTF-8 names usable as paths.
+        status_result = run_git_command(
+            ['status', '--porcelain=v1', '-z', '--branch'], cwd,
+            env={'LC_ALL': 'C'}, errors='surrogateescape',
+        )
 
         if status_result['returncode'] != 0:
             return ToolResult.fail(f"Git status failed: {status_result['stderr']}")
 
         # Parse porcelain output
+        branch = ""
         modified_files: List[str] = []
         untracked_files: List[str] = []
         staged_files: List[str] = []
         deleted_files: List[str] = []
+        files_by_kind = {
+            "staged": staged_files,
+            "modified": modified_files,
+            "deleted": deleted_files,
+        }
 
         # Don't use strip() - it removes leading spaces that are part of porcelain format
-        for line in status_result['stdout'].split('\n'):
+        entries = iter(status_result['stdout'].split('\0'))
+        for line in entries:
+            if line.startswith('## '):
+                branch = _parse_branch_header(line[3:])
+                continue
+
             if not line or len(line) < 3:
                 continue
 
             # Format: XY filename
             # X = index status (position 0), Y = work tree status (position 1)
             # Position 2 is always a space, filename starts at position 3
-            x_status = line[0]
-            y_status = line[1]
             filename = line[3:]
 
-            # Staged changes (index)
-            if x_status == 'M':
-                staged_files.append(filename)
-            elif x_status == 'A':
-                staged_files.append(filename)
-            elif x_status == 'D':
-                deleted_files.append(filename)
-
-            # Work tree changes
-            if y_status == 'M':
-                modified_files.append(filename)
-            elif y_status == 'D':
-                deleted_files.append(filename)
+            # Renames and copies are followed by the original path as an
+            # entry of its own
+            status = line[:2]
+            if 'R' in status or 'C' in status:
+                next(entries, None)
 
             # Untracked
-            if x_status == '?' and y_status == '?':
+            if line.startswith('??'):
                 untracked_files.append(filename)
+                continue
+
+            # Staged changes (index)
+            kind = _INDEX_STATUS_KINDS.get(line[0])
+            if kind:
+                files_by_kind[kind].append(filename)
+
+            # Work tree changes
+            kind = _WORKTREE_STATUS_KINDS.get(line[1])
+            if kind:
+                files_by_kind[kind].append(filename)
 
         # Build structured output
         git_status = {
@@ -136,7 +235,7 @@ class GitStatusTool(BaseTool):
                 "deleted_files": deleted_files,
             },
             "branch": branch,
-            "is_clean": not any([modified_files, untracked_files, staged_files, deleted_files]),
+            "is_clean": not (modified_files or untracked_files or staged_files or deleted_files),
         }
 
         total_changes = len(modified_files) + len(untracked_files) + len(staged_files)
@@ -168,6 +267,13 @@ class GitDiffTool(BaseTool):
             required=False,
             default=True,
         ),
+        ToolParam(
+            name="metadata_only",
+            type="bool",
+            description="Only report each hunk's position and line counts, not its content",
+            required=False,
+            default=False,
+        ),
         ToolParam(
             name="cwd",
             type="string",
@@ -180,6 +286,7 @@ class GitDiffTool(BaseTool):
     def execute(self, **params) -> ToolResult:
         """Get git diff."""
         staged = params.get("staged", True)
+        metadata_only = params.get("metadata_only", False)
         cwd = params.get("cwd")
 
         args = ['diff']
@@ -193,7 +300,7 @@ class GitDiffTool(BaseTool):
 
         # Parse diff output
         diff_output = result['stdout']
-        git_diff = self._parse_diff(diff_output)
+        git_diff = self._parse_diff(diff_output, metadata_only)
 
         return ToolResult.ok(
             data={
@@ -203,17 +310,52 @@ class GitDiffTool(BaseTool):
             summary=f"{len(git_diff)} files changed",
         )
 
-    def _parse_diff(self, diff_output: str) -> List[Dict[str, Any]]:
-        """Parse unified diff format into structured data."""
+    def _parse_diff(self, diff_output: str, metadata_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        Parse unified diff format into structured data.
+
+        A single pass over the lines: inside a hunk, lines are collected
+        until the next hunk header or file header, which is then handled
+        like any other line. With metadata_only, changed lines are only
+        counted; their text is never sliced out or joined.
+        """
+        keep_text = not metadata_only
         files: List[Dict[str, Any]] = []
         current_file = None
         current_changes: List[Dict[str, Any]] = []
 
-        lines = diff_output.split('\n')
-        i = 0
+        # Hunk being collected (in_hunk), with its start in the new file
+        in_hunk = False
+        new_start = 0
+        hunk_added: List[Optional[str]] = []
+        hunk_removed: List[Optional[str]] = []
+
+        # split('\n') rather than splitlines(): a '\r' or other line
+        # boundary inside a changed line is content, not a line break
+        for line in diff_output.split('\n'):
+            if in_hunk:
+                # Dispatch on the first character: added, removed and
+                # context lines each take one comparison or two, and only
+                # lines starting with '@' or 'd' can end the hunk
+                first = line[:1]
+                if first == '+':
+                    if not line.startswith('+++'):
+                        hunk_added.append(line[1:] if keep_text else None)
+                    continue
+                if first == '-':
+                    if not line.startswith('---'):
+                        hunk_removed.append(line[1:] if keep_text else None)
+                    continue
+                if not ((first == '@' and line.startswith('@@'))
+                        or (first == 'd' and line.startswith('diff'))):
+                    continue
 
-        while i < len(lines):
-            line = lines[i]
+                # Hunk ended
+                in_hunk = False
+                if hunk_added or hunk_removed:
+                    current_changes.append(
+                        self._hunk_change(new_start, hunk_added, hunk_removed, keep_text)
+                    )
 
             # New file
             if line.startswith('diff --git'):
@@ -225,42 +367,23 @@ class GitDiffTool(BaseTool):
                     })
 
                 # Extract filename
-                match = re.search(r'b/(.+)$', line)
-                current_file = match.group(1) if match else "unknown"
+                current_file = self._diff_header_path(line)
                 current_changes = []
 
             # Hunk header
             elif line.startswith('@@'):
-                match = re.match(r'@@ -(\d+),?\d* \+(\d+),?\d* @@', line)
+                match = _HUNK_HEADER_RE.match(line)
                 if match:
-                    old_start = int(match.group(1))
                     new_start = int(match.group(2))
-
-                    # Collect hunk changes
                     hunk_added = []
                     hunk_removed = []
-                    i += 1
-
-                    while i < len(lines) and not lines[i].startswith('@@') and not lines[i].startswith('diff'):
-                        hunk_line = lines[i]
-                        if hunk_line.startswith('+') and not hunk_line.startswith('+++'):
-                            hunk_added.append(hunk_line[1:])
-                        elif hunk_line.startswith('-') and not hunk_line.startswith('---'):
-                            hunk_removed.append(hunk_line[1:])
-                        i += 1
-
-                    if hunk_added or hunk_removed:
-                        current_changes.append({
-                            "line_start": new_start,
-                            "line_end": new_start + len(hunk_added),
-                            "added": '\n'.join(hunk_added) if hunk_added else None,
-                            "removed": '\n'.join(hunk_removed) if hunk_removed else None,
-                        })
-                    continue
+                    in_hunk = True
 
-            i += 1
-
-        # Save last file
+        # Save last hunk and file
+        if in_hunk and (hunk_added or hunk_removed):
+            current_changes.append(
+                self._hunk_change(new_start, hunk_added, hunk_removed, keep_text)
+            )
         if current_file:
             files.append({
                 "file": current_file,
@@ -269,6 +392,45 @@ class GitDiffTool(BaseTool):
 
         return files
 
+    @staticmethod
+    def _diff_header_path(line: str) -> str:
+        """Get the new path from a `diff --git` header line."""
+        if line.endswith('"'):
+            match = _QUOTED_DIFF_FILE_RE.search(line)
+            return _unquote_path(match.group(1)) if match else "unknown"
+
+        # Unless the file was renamed, the header is "a/<path> b/<path>":
+        # take the second half, which is right even if the path has " b/"
+        paths = line[len('diff --git '):]
+        half = (len(paths) - 1) // 2
+        if paths[half:half + 3] == ' b/' and paths[2:half] == paths[half + 3:]:
+            return paths[half + 3:]
+
+        match = _DIFF_FILE_RE.search(line)
+        return match.group(1) if match else "unknown"
+
+    @staticmethod
+    def _hunk_change(
+        new_start: int,
+        added: List[Optional[str]],
+        removed: List[Optional[str]],
+        keep_text: bool = True,
+    ) -> Dict[str, Any]:
+        """Build the change entry for one hunk."""
+        if not keep_text:
+            return {
+                "line_start": new_start,
+                "line_end": new_start + len(added),
+                "added_count": len(added),
+                "removed_count": len(removed),
+            }
+        return {
+            "line_start": new_start,
+            "line_end": new_start + len(added),
+            "added": '\n'.join(added) if added else None,
+            "removed": '\n'.join(removed) if removed else None,
+        }
+
 
 @register_tool
 class GitCommitTool(BaseTool):
@@ -307,8 +469,9 @@ class GitCommitTool(BaseTool):
         if not message.startswith("Ephraim:"):
             message = f"Ephraim: {message}"
 
-        # Execute commit
-        result = run_git_command(['commit', '-m', message], cwd)
+        # Execute commit; core.abbrev=8 makes the hash in its output at least
+        # as long as the one reported below
+        result = run_git_command(['-c', 'core.abbrev=8', 'commit', '-m', message], cwd)
 
         if result['returncode'] != 0:
             # Check if there's nothing to commit
@@ -328,19 +491,21 @@ class GitCommitTool(BaseTool):
         }
 
         # Parse stats line: "2 files changed, 4 insertions(+), 1 deletion(-)"
-        stats_match = re.search(
-            r'(\d+) files? changed(?:, (\d+) insertions?\(\+\))?(?:, (\d+) deletions?\(-\))?',
-            stdout,
-        )
+        stats_match = _CHANGE_STATS_RE.search(stdout)
         if stats_match:
-            commit_info['files_changed'] = int(stats_match.group(1))
-            commit_info['insertions'] = int(stats_match.group(2) or 0)
-            commit_info['deletions'] = int(stats_match.group(3) or 0)
-
-        # Get commit hash
-        hash_result = run_git_command(['rev-parse', 'HEAD'], cwd)
-        if hash_result['returncode'] == 0:
-            commit_info['commit_hash'] = hash_result['stdout'].strip()[:8]
+            commit_info['files_changed'] = int(stats_match['files'])
+            commit_info['insertions'] = int(stats_match['insertions'] or 0)
+            commit_info['deletions'] = int(stats_match['deletions'] or 0)
+
+        # Get commit hash from the commit's own output, asking git only if
+        # that line isn't there
+        header_match = _COMMIT_HEADER_RE.match(stdout)
+        if header_match:
+            commit_info['commit_hash'] = header_match.group(1)[:8]
+        else:
+            hash_result = run_git_command(['rev-parse', 'HEAD'], cwd)
+            if hash_result['returncode'] == 0:
+                commit_info['commit_hash'] = hash_result['stdout'].strip()[:8]
 
         return ToolResult.ok(
             data={"git_commit": commit_info},
@@ -359,6 +524,9 @@ class GitAddTool(BaseTool):
     description = "Stage files for commit"
     category = ToolCategory.GIT
 
+    # Above this many files, paths are piped to git instead of passed as argv
+    ARGV_FILE_LIMIT = 64
+
     parameters = [
         ToolParam(
             name="files",
@@ -383,7 +551,16 @@ class GitAddTool(BaseTool):
         if not files:
             return ToolResult.fail("No files specified")
 
-        result = run_git_command(['add'] + files, cwd)
+        if len(files) > self.ARGV_FILE_LIMIT:
+            # Pass long path lists on stdin, NUL-separated, instead of as
+            # arguments, so they can't run into the argv size limit
+            result = run_git_command(
+                ['add', '--pathspec-from-file=-', '--pathspec-file-nul'],
+                cwd,
+                input=b'\0'.join(os.fsencode(f) for f in files),
+            )
+        else:
+            result = run_git_command(['add'] + files, cwd)
 
         if result['returncode'] != 0:
             return ToolResult.fail(f"Git add failed: {result['stderr']}")
@@ -405,10 +582,10 @@ def git_status(cwd: Optional[str] = None) -> Dict[str, Any]:
     return result.data if result.success else {"error": result.error}
 
 
-def git_diff(staged: bool = True, cwd: Optional[str] = None) -> Dict[str, Any]:
+def git_diff(staged: bool = True, cwd: Optional[str] = None, metadata_only: bool = False) -> Dict[str, Any]:
     """Get git diff as structured dict."""
     tool = GitDiffTool()
-    result = tool(staged=staged, cwd=cwd)
+    result = tool(staged=staged, cwd=cwd, metadata_only=metadata_only)
     return result.data if result.success else {"error": result.error}
 
 
@@ -573,14 +750,11 @@ class GitPullTool(BaseTool):
         insertions = 0
         deletions = 0
 
-        stats_match = re.search(
-            r'(\d+) files? changed(?:, (\d+) insertions?\(\+\))?(?:, (\d+) deletions?\(-\))?',
-            stdout,
-        )
+        stats_match = _CHANGE_STATS_RE.search(stdout)
         if stats_match:
-            files_changed = int(stats_match.group(1))
-            insertions = int(stats_match.group(2) or 0)
-            deletions = int(stats_match.group(3) or 0)
+            files_changed = int(stats_match['files'])
+            insertions = int(stats_match['insertions'] or 0)
+            deletions = int(stats_match['deletions'] or 0)
 
         already_up_to_date = 'Already up to date' in stdout or 'Already up-to-date' in stdout
 
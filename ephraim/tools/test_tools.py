@@ -15,7 +15,7 @@ import re
 import subprocess
 from typing import Dict, Any, List, Optional
 
-from .base import BaseTool, ToolResult, ToolParam, ToolCategory, register_tool
+from .base import BaseTool, ToolResult, ToolParam, ToolCategory, register_tool, tool_registry
 
 
 def run_command(
@@ -598,7 +598,7 @@ class SuggestTestFixTool(BaseTool):
         test_name = params.get("test_name")
 
         # First analyze the failure
-        analyze_tool = AnalyzeTestFailureTool()
+        analyze_tool = tool_registry.get(AnalyzeTestFailureTool.name)
         analysis_result = analyze_tool(test_output=test_output, test_name=test_name)
 
         if not analysis_result.success:
@@ -38,23 +38,31 @@ DANGEROUS_EXTENSIONS = [
 ]
 
 
+# DANGEROUS_PATHS lowercased once, each with its subtree prefix
+_DANGEROUS_PREFIXES = [(p.lower(), p.lower() + os.sep) for p in DANGEROUS_PATHS]
+
+# Dangerous directories whose whole subtree is blocked too
+_BLOCKED_SUBTREES = frozenset(['/usr', '/var', 'c:\\windows', 'c:\\program files'])
+
+
 def is_dangerous_path(path: str) -> bool:
     """Check if a path is dangerous to write to."""
     path_lower = os.path.abspath(path).lower()
+    home = None
 
     # Check exact matches and prefixes
-    for dangerous in DANGEROUS_PATHS:
-        dangerous_lower = dangerous.lower()
+    for dangerous_lower, subtree_prefix in _DANGEROUS_PREFIXES:
         if path_lower == dangerous_lower:
             return True
         # Check if trying to write directly in a dangerous directory
-        if path_lower.startswith(dangerous_lower + os.sep):
+        if path_lower.startswith(subtree_prefix):
             # Allow subdirectories of user home
-            home = os.path.expanduser('~').lower()
+            if home is None:
+                home = os.path.expanduser('~').lower()
             if path_lower.startswith(home):
                 return False
             # Block system directories
-            if dangerous_lower in ['/usr', '/var', 'c:\\windows', 'c:\\program files']:
+            if dangerous_lower in _BLOCKED_SUBTREES:
                 return True
 
     return False
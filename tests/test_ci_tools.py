@@ -0,0 +1,66 @@
+"""Tests for the CI tools."""
+
+from types import SimpleNamespace
+
+from ephraim.tools import ci_tools
+from ephraim.tools.ci_tools import AnalyzeCIFailureTool, WaitForCITool, _LogAnalysis
+
+
+def analyze(logs):
+    return AnalyzeCIFailureTool()._analyze_logs(logs)
+
+
+def test_error_detail_on_same_line():
+    assert analyze("Error: boom\n")["details"] == ["boom"]
+
+
+def test_error_detail_does_not_span_lines():
+    # The patterns are line-local, so a message on the next line is not
+    # taken as the detail of a bare "Error:"
+    assert analyze("Error:\n  message\n")["details"] == []
+
+
+def test_failed_test_does_not_span_lines():
+    assert analyze("FAILED\ntests/test_a.py::test_b\n")["failed_tests"] == []
+
+
+def test_failed_test_on_same_line():
+    result = analyze("FAILED tests/test_a.py::test_b - assert 1 == 2\n")
+    assert result["failed_tests"] == ["tests/test_a.py::test_b"]
+
+
+def test_block_feeding_matches_one_shot():
+    logs = "".join(
+        f"tests/test_m.py:{i}: AssertionError: bad {i}\nFAILED tests/test_m.py::test_{i}\n"
+        for i in range(50)
+    )
+    tool = AnalyzeCIFailureTool()
+    one_shot = tool._analyze_logs(logs)
+
+    analysis = _LogAnalysis(tool._ERROR_MATCHERS, tool.ERROR_PREFILTERS)
+    lines = logs.splitlines(keepends=True)
+    for i in range(0, len(lines), 7):
+        analysis.feed("".join(lines[i:i + 7]))
+    assert analysis.result() == one_shot
+
+
+def test_wait_for_ci_backoff_survives_long_waits(monkeypatch):
+    clock = SimpleNamespace(now=0.0, sleeps=[])
+
+    def sleep(seconds):
+        clock.sleeps.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(ci_tools, "time", SimpleNamespace(time=lambda: clock.now, sleep=sleep))
+    monkeypatch.setattr(ci_tools, "get_repo_info", lambda cwd: {"owner": "o", "repo": "r"})
+    monkeypatch.setattr(
+        ci_tools, "_api_run_status",
+        lambda owner, repo, run_id, etag: ("etag", {"status": "in_progress"}),
+    )
+
+    result = WaitForCITool()(run_id=1, timeout=10000, poll_interval=2, cwd="/tmp")
+
+    assert not result.success
+    assert "Timeout" in result.error
+    assert len(clock.sleeps) > 2000
+    assert max(clock.sleeps) == 2